@@ -29,16 +29,148 @@
 #
 # *******************************************************************************
 
+import hashlib
+import os
+import re
+import tempfile
 import MySQLdb as db
+from MySQLdb.constants import CLIENT
 
 class CDataBase(object):
    """
 CDataBase class play a role as mysqlclient and provide methods to interact
 with TestResultWebApp's database.
+
+All queries are executed with one cursor which is kept open as long as the
+connection, therefore an object of this class must not be shared between
+threads.
    """
    __single = None
 
-   __NUM_BUFFERD_ELEMENTS_FOR_EXECUTEMANY=100
+   # Hosts which are connected without compression by default.
+   __LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+   # Connections which are kept open after disconnect for reuse within the
+   # same process, key is the tuple of connection parameters (with a hash of
+   # the password instead of the password itself).
+   __dConnectionCache = {}
+
+   __NUM_BUFFERD_ELEMENTS_FOR_EXECUTEMANY=10000
+
+   # Part of max_allowed_packet which is used for a single bulk insert statement,
+   # the rest is kept as reserve for the statement itself and escaping.
+   __PACKET_USAGE_RATIO = 0.9
+
+   # Minimum number of buffered test cases which are imported with
+   # "load data local infile" instead of a multi-row insert statement.
+   __LOAD_DATA_THRESHOLD = 5000
+
+   # Error numbers of "load data local infile" which is refused by the server
+   # (ER_NOT_ALLOWED_COMMAND, ER_CLIENT_LOCAL_FILES_DISABLED) or by the client
+   # (CR_LOAD_DATA_LOCAL_INFILE_REJECTED). The file is not read in these cases.
+   __LOCAL_INFILE_REFUSED_ERRORS = (1148, 3948, 2068)
+
+   # Split a single row "insert ... values (%s,...)" query into its statement
+   # prefix, the row placeholder group and an optional trailing clause.
+   __RE_INSERT_VALUES = re.compile(r"\s*((?:INSERT|REPLACE)\s.+\sVALUES?\s*)"
+                                   r"(\(\s*%s\s*(?:,\s*%s\s*)*\))"
+                                   r"(\s*(?:ON DUPLICATE.*)?);?\s*\Z",
+                                   re.IGNORECASE | re.DOTALL)
+
+   # Queries which are executed frequently, the database is the default schema
+   # of the connection, therefore table names are not qualified.
+   __SQL = {
+      # insert project/variant/branch only if it is not existing yet,
+      # this does not require an unique key on tbl_prj
+      "insert_prj"       : """insert into tbl_prj
+            ( variant,project, branch) select %s, %s, %s from dual
+            where not exists (select 1 from tbl_prj where
+            (project=%s and variant=%s and branch=%s))""",
+
+      "insert_result"    : """insert into tbl_result (test_result_id,
+            variant,project,branch, time_start,time_end, version_sw_target,
+            version_sw_test,version_hardware,jenkinsurl,reporting_qualitygate,result_state,
+            interpretation)
+            values (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)""",
+
+      "insert_file"      : """insert into tbl_file (name,tester_account,
+            tester_machine,time_start,time_end,test_result_id,origin)
+            values (%s,%s,%s,%s,%s,%s,%s)""",
+
+      "insert_file_header" : """insert into tbl_file_header
+                     ( file_id,
+                       testtoolconfiguration_testtoolname,
+                       testtoolconfiguration_testtoolversionstring,
+                       testtoolconfiguration_projectname,
+                       testtoolconfiguration_logfileencoding,
+                       testtoolconfiguration_pythonversion,
+                       testtoolconfiguration_testfile,
+                       testtoolconfiguration_logfilepath,
+                       testtoolconfiguration_logfilemode,
+                       testtoolconfiguration_ctrlfilepath,
+                       testtoolconfiguration_configfile,
+                       testtoolconfiguration_confname,
+
+                       testfileheader_author,
+                       testfileheader_project,
+                       testfileheader_testfiledate,
+                       testfileheader_version_major,
+                       testfileheader_version_minor,
+                       testfileheader_version_patch,
+                       testfileheader_keyword,
+                       testfileheader_shortdescription,
+                       testexecution_useraccount,
+                       testexecution_computername,
+
+                       testrequirements_documentmanagement,
+                       testrequirements_testenvironment,
+
+                       testbenchconfig_name,
+                       testbenchconfig_data,
+                       preprocessor_filter,
+                       preprocessor_parameters)
+               values ( %s, %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s, %s,
+                        %s, %s, %s,%s,%s,%s,%s,%s,%s,%s,%s,%s)""",
+
+      "insert_single_case" : """insert into tbl_case (name, issue, tcid, fid,
+            testnumber, repeatcount, component, time_start, result_main, result_state,
+            result_return, counter_resets, lastlog, test_result_id, file_id)
+            values (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)""",
+
+      "insert_case"      : """insert into tbl_case (name, issue, tcid, fid,
+            testnumber, repeatcount, component, time_start, result_main, result_state,
+            result_return, counter_resets, test_result_id, file_id, lastlog)
+            values (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)""",
+
+      "update_result_category" : """update tbl_result set category_main=%s
+            where test_result_id=%s""",
+
+      "update_result_start_end_time" : """update tbl_result set time_start=%s, time_end=%s
+            where test_result_id=%s""",
+
+      "update_result_end_time" : """update tbl_result set time_end=%s
+            where test_result_id=%s""",
+
+      "update_file_end_time" : """update tbl_file set time_end=%s where file_id=%s""",
+
+      # default file format: tab separated fields, backslash escaping, \N as NULL
+      "load_case"        : """load data local infile %s into table tbl_case
+            character set utf8mb4 (name, issue, tcid, fid,
+            testnumber, repeatcount, component, time_start, result_main, result_state,
+            result_return, counter_resets, test_result_id, file_id, lastlog)""",
+
+      "insert_ccr"       : """insert into tbl_ccr (test_case_id, timestamp, MEM, CPU) values(%s,%s,%s,%s)""",
+
+      "load_ccr"         : """load data local infile %s into table tbl_ccr
+            character set utf8mb4 (test_case_id, timestamp, MEM, CPU)""",
+
+      "insert_usr_result" : """insert into tbl_usr_result (test_result_id, tags)
+            values (%s,%s)""",
+
+      "insert_abort"     : """insert into tbl_abort
+            (test_result_id, abort_reason, msg_detail)
+            values (%s,%s,%s)""",
+   }
 
    #make the CDataBase to singleton
    #! __new__ requires inheritance from "object" !
@@ -53,13 +185,54 @@ Create object method to make singleton class ``CDataBase``.
          classtype.__single = object.__new__(classtype)
       return classtype.__single
 
-   def __init__(self):
+   def __init__(self, iBatchSize=None,
+                      iMaxPacketSize=None):
       """
 Initializer of class ``CDataBase``.
+
+``CDataBase`` is a singleton, therefore the object is initialized only once.
+Further constructions return the existing object, so that buffered test cases
+are not discarded. Only the arguments which are given explicitly (not None)
+are applied to the existing object.
+
+**Arguments:**
+
+*  ``iBatchSize``
+
+   / *Condition*: optional / *Type*: int / *Default*: None /
+
+   Maximum number of buffered elements which are inserted with a single
+   bulk insert statement.
+   If None, 10000 is used (or the existing value is kept on re-initialization).
+
+*  ``iMaxPacketSize``
+
+   / *Condition*: optional / *Type*: int / *Default*: None /
+
+   Maximum size (in bytes) of a packet which is sent to the database.
+   If None, the ``max_allowed_packet`` value of the connected server is used,
+   it is queried again on each ``connect``.
       """
-      con      = None
-      db       = None
+      if getattr(self, "bInitialized", False):
+         if iBatchSize is not None:
+            self.iBatchSize = iBatchSize
+         if iMaxPacketSize is not None:
+            self.iMaxPacketSizeSetting = iMaxPacketSize
+            self.iMaxPacketSize = iMaxPacketSize
+         return
+      if iBatchSize is None:
+         iBatchSize = CDataBase.__NUM_BUFFERD_ELEMENTS_FOR_EXECUTEMANY
+      self.bInitialized = True
+      self.con = None
+      self.db  = None
+      self.cur = None
       self.lTestCases = []
+      self.lTags = []
+      self.lPendingEvtblIDs = []
+      self.iBatchSize = iBatchSize
+      # explicitly given packet size, None to use the value of the server
+      self.iMaxPacketSizeSetting = iMaxPacketSize
+      self.iMaxPacketSize = iMaxPacketSize
 
    def __del__(self):
       pass
@@ -68,8 +241,13 @@ Initializer of class ``CDataBase``.
                     user        = None,
                     passwd      = None,
                     database    = None,
-                    charset     = 'utf8',
-                    use_unicode = True):
+                    charset     = 'utf8mb4',
+                    use_unicode = True,
+                    bKeepAlive  = False,
+                    bLocalInfile = False,
+                    bCompress   = None,
+                    port        = 3306,
+                    bReadCommitted = False):
       """
 Connect to the database with provided authentication and db info.
 
@@ -101,9 +279,10 @@ Connect to the database with provided authentication and db info.
 
 *  ``charset``
 
-   / *Condition*: optional / *Type*: str / *Default*: 'utf8' /
+   / *Condition*: optional / *Type*: str / *Default*: 'utf8mb4' /
 
-   The connection character set.
+   The connection character set. ``utf8mb4`` matches the default character
+   set of the server tables, so no conversion is required.
 
 *  ``use_unicode``
 
@@ -112,6 +291,47 @@ Connect to the database with provided authentication and db info.
    If True, CHAR and VARCHAR and TEXT columns are returned as Unicode strings,
    using the configured character set.
 
+*  ``bKeepAlive``
+
+   / *Condition*: optional / *Type*: bool / *Default*: False /
+
+   If True, the connection is kept open on ``disconnect`` and reused by the
+   next ``connect`` with the same parameters within this process.
+   The session state of a reused connection is reset. This avoids
+   the connection setup and authentication cost when the import is invoked
+   repeatedly, e.g. from a long-running service.
+
+*  ``bLocalInfile``
+
+   / *Condition*: optional / *Type*: bool / *Default*: False /
+
+   If True, large batches of test cases and CCR data are imported with
+   ``load data local infile`` which is faster than multi-row insert statements.
+   It requires ``local_infile`` to be enabled on the server.
+
+*  ``bCompress``
+
+   / *Condition*: optional / *Type*: bool / *Default*: None /
+
+   If True, the client/server protocol is compressed which reduces the
+   transferred data of bulk inserts over slow networks.
+   If None, compression is used for all hosts except the local one
+   (``localhost``, ``127.0.0.1``, ``::1`` in any letter case).
+
+*  ``port``
+
+   / *Condition*: optional / *Type*: int / *Default*: 3306 /
+
+   TCP port of the database server.
+
+*  ``bReadCommitted``
+
+   / *Condition*: optional / *Type*: bool / *Default*: False /
+
+   If True, the session uses READ COMMITTED isolation which reduces locking
+   overhead of bulk inserts. It must not be used with ``binlog_format=STATEMENT``
+   on the server, InnoDB rejects inserts under READ COMMITTED in this case.
+
 **Returns:**
 
 (*no returns*)
@@ -122,17 +342,92 @@ Connect to the database with provided authentication and db info.
 
       self.db = database
 
-      # default encoding of python is latin-1,
-      # therefore we force mysql to convert to encode to utf8.
-      self.con = db.connect(host,user,passwd,db=database,charset=charset,use_unicode=use_unicode)
+      if bCompress is None:
+         bCompress = host is not None and host.lower() not in CDataBase.__LOCAL_HOSTS
+
+      self.tConnectionKey = None
+      self.con = None
+      if bKeepAlive:
+         # the password is part of the key, so that a connection is never
+         # reused with other credentials, but only its hash is kept
+         self.tConnectionKey = (host, port, user,
+                                hashlib.sha256(passwd.encode("utf-8")).hexdigest(),
+                                database, bLocalInfile, bCompress, bReadCommitted)
+         self.con = CDataBase.__dConnectionCache.pop(self.tConnectionKey, None)
+         if self.con is not None:
+            try:
+               self.con.ping()
+               self.con.set_character_set(charset)
+               # checks may be left disabled by an aborted bulk import of the
+               # previous user of the connection
+               c = self.con.cursor()
+               c.execute("SET FOREIGN_KEY_CHECKS=1, UNIQUE_CHECKS=1")
+               c.close()
+            except db.Error:
+               # connection is gone meanwhile, open a new one
+               self.con = None
+      if self.con is None:
+         # default encoding of python is latin-1,
+         # therefore we force mysql to convert to encode to utf8.
+         # The database is the default schema of the connection, therefore table
+         # names in queries are not qualified with the database name.
+         # Multiple statements are allowed to send several queries within one round-trip.
+         dConnectArgs = {}
+         if bReadCommitted:
+            # set once with the connection
+            dConnectArgs["init_command"] = "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED"
+         self.con = db.connect(host,user,passwd,db=database,port=port,charset=charset,use_unicode=use_unicode,
+                               client_flag=CLIENT.MULTI_STATEMENTS|CLIENT.MULTI_RESULTS,
+                               local_infile=int(bLocalInfile),
+                               compress=int(bCompress),
+                               **dConnectArgs)
+      self.bLocalInfile = bLocalInfile
       #for test purpose activate autocommit with (True)
       self.con.autocommit(False)
+      self.cur = self.con.cursor()
+      # encoded statement parts are bound to the connection
+      self.dBulkInsertParts = {}
+      if self.iMaxPacketSizeSetting is None:
+         self.iMaxPacketSize = self.__arExecOne("select @@max_allowed_packet")[0]
+      else:
+         self.iMaxPacketSize = self.iMaxPacketSizeSetting
       print("Successfully connected to: %s@%s" % (self.db, host))
 
    def disconnect(self):
       """
 Disconnect from TestResultWebApp's database.
 
+If the connection was opened with ``bKeepAlive``, pending changes are
+committed but the connection is kept open for reuse.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+(*no returns*)
+      """
+      self.__vFlushTags()
+      lTestResultIDs = self.lPendingEvtblIDs
+      self.lPendingEvtblIDs = []
+      self.vUpdateEvtblList(lTestResultIDs)
+      self.vCommit()
+      self.cur.close()
+      self.cur = None
+      if self.tConnectionKey is not None:
+         CDataBase.__dConnectionCache[self.tConnectionKey] = self.con
+      else:
+         self.con.close()
+
+   def vCommit(self):
+      """
+Commit the current transaction.
+
+Autocommit is disabled for the connection, so that all changes of an import
+are grouped into a single transaction. Changes are committed on ``disconnect``
+and after ``cleanAllTables`` only, a failed import leaves no partial result.
+
 **Arguments:**
 
 (*no arguments*)
@@ -142,11 +437,30 @@ Disconnect from TestResultWebApp's database.
 (*no returns*)
       """
       self.con.commit()
-      self.con.close()
+
+   def vRollback(self):
+      """
+Roll back the current transaction, e.g. after a failed import.
+
+Buffered test cases, tags and pending evtbl updates are discarded as well.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+(*no returns*)
+      """
+      self.lTestCases = []
+      self.lTags = []
+      self.lPendingEvtblIDs = []
+      self.con.rollback()
 
    def cleanAllTables(self):
       """
-Delete all table data. Please be careful before calling this method.
+Delete all table data within a single transaction. Please be careful before
+calling this method.
 
 **Arguments:**
 
@@ -157,34 +471,24 @@ Delete all table data. Please be careful before calling this method.
 (*no returns*)
       """
       print(">> Deleting all table data!")
-      sql="""delete from """ + self.db + """.evtbl_result_main where test_result_id!="" """
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.evtbl_failed_unknown_per_component where test_result_id!="" """
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_usr_case where test_case_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_usr_case_history where test_case_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_usr_comments where test_case_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_usr_links where test_case_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_usr_result where test_result_id!="" """
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_usr_result_history where test_result_id!="" """
-      self.__arExec(sql)
-
-      sql="""delete from """ + self.db + """.tbl_file_header where file_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_case where test_case_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_file where file_id>0"""
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_result where test_result_id!="" """
-      self.__arExec(sql)
-      sql="""delete from """ + self.db + """.tbl_prj where project<>"a" """
-      self.__arExec(sql)
-      self.con.commit()
+      lSql = [
+         """delete from evtbl_result_main where test_result_id!="" """,
+         """delete from evtbl_failed_unknown_per_component where test_result_id!="" """,
+         """delete from tbl_usr_case where test_case_id>0""",
+         """delete from tbl_usr_case_history where test_case_id>0""",
+         """delete from tbl_usr_comments where test_case_id>0""",
+         """delete from tbl_usr_links where test_case_id>0""",
+         """delete from tbl_usr_result where test_result_id!="" """,
+         """delete from tbl_usr_result_history where test_result_id!="" """,
+
+         """delete from tbl_file_header where file_id>0""",
+         """delete from tbl_case where test_case_id>0""",
+         """delete from tbl_file where file_id>0""",
+         """delete from tbl_result where test_result_id!="" """,
+         """delete from tbl_prj where project<>"a" """,
+      ]
+      self.__vExecMulti(lSql)
+      self.vCommit()
 
    def __arExec(self, command, values=None, bHasResponse=False, bReturnInsertedID=False):
       """
@@ -225,18 +529,17 @@ Execute a query. By default don't try to fetch a result.
    List of reponse data (or lastrowid if bReturnInsertedID is set).
       """
       arRes = None
-      c = self.con.cursor()
+      c = self.cur
       c.execute(command,values)
       if bHasResponse:
          arRes = c.fetchall()
       elif bReturnInsertedID:
          arRes = c.lastrowid
-      c.close()
       return arRes
 
-   def __vExecMany(self, command, values=None):
+   def __arExecOne(self, command, values=None):
       """
-Execute a query for bulk insert of many elements. No response expected.
+Execute a query and fetch only the first row of the response.
 
 **Arguments:**
 
@@ -254,40 +557,163 @@ Execute a query for bulk insert of many elements. No response expected.
 
 **Returns:**
 
+*  ``arRow``
+
+   / *Type*: tuple /
+
+   First row of response data, None if the response is empty.
+      """
+      c = self.cur
+      c.execute(command,values)
+      return c.fetchone()
+
+   def __vExecMulti(self, commands, values=None):
+      """
+Execute several queries within a single round-trip. No response expected.
+
+**Arguments:**
+
+*  ``commands``
+
+   / *Condition*: required / *Type*: list /
+
+   List of queries need to be executed.
+
+*  ``values``
+
+   / *Condition*: optional / *Type*: list / *Default*: None /
+
+   Sequence of parameters to be used with all queries (in order of queries).
+
+**Returns:**
+
 (*no returns*)
       """
-      c = self.con.cursor()
-      c.executemany(command,values)
-      c.close()
+      c = self.cur
+      c.execute(";\n".join(commands), values)
+      # all result sets need to be consumed before the next query,
+      # errors of subsequent statements are raised here
+      while c.nextset():
+         pass
+
+   def __vExecMany(self, command, values=None, sBefore=None, sAfter=None):
+      """
+Execute a query for bulk insert of many elements. No response expected.
+
+Insert queries are rewritten to multi-row ``insert ... values (...),(...)``
+statements, so that each chunk of elements is sent to the database within a
+single round-trip. A chunk is limited by the batch size and by the maximum
+packet size of the connection.
+Other queries are passed to ``executemany`` of the driver.
+
+**Arguments:**
+
+*  ``command``
 
-   def __nGetLastInsertID(self, tbl):
+   / *Condition*: required / *Type*: str /
+
+   Query need to be executed.
+
+*  ``values``
+
+   / *Condition*: optional / *Type*: list / *Default*: None /
+
+   Sequence of parameters to be used with the query.
+
+*  ``sBefore``
+
+   / *Condition*: optional / *Type*: str / *Default*: None /
+
+   Query without parameters which is executed before the first chunk.
+   For insert queries it is sent within the same round-trip as the first chunk.
+
+*  ``sAfter``
+
+   / *Condition*: optional / *Type*: str / *Default*: None /
+
+   Query without parameters which is executed after the last chunk.
+   For insert queries it is sent within the same round-trip as the last chunk.
+
+**Returns:**
+
+(*no returns*)
       """
-Return the last_insert_id of a given table.
+      if not values:
+         return
+
+      c = self.cur
+      tBulkInsert = self.__tGetBulkInsertParts(command)
+      if tBulkInsert is not None:
+         # rows are escaped by the driver (in C) and joined as bytes directly,
+         # this avoids formatting one large statement with all parameters and
+         # allows to limit the chunk by its real size
+         bPrefix, bSuffix = tBulkInsert
+         sEncoding = self.con.encoding
+         bBefore = (sBefore + ";\n").encode(sEncoding) if sBefore else b""
+         bAfter = (";\n" + sAfter).encode(sEncoding) if sAfter else b""
+         iMaxChunkBytes = int(self.iMaxPacketSize * CDataBase.__PACKET_USAGE_RATIO) \
+                          - len(bPrefix) - len(bSuffix) - len(bBefore) - len(bAfter)
+         literal = self.con.literal
+         lChunk = []
+         iChunkBytes = 0
+         for row in values:
+            bRow = literal(row)
+            if lChunk and (len(lChunk) >= self.iBatchSize or
+                           iChunkBytes + len(bRow) > iMaxChunkBytes):
+               c.execute(bBefore + bPrefix + b",".join(lChunk) + bSuffix)
+               while c.nextset():
+                  pass
+               bBefore = b""
+               lChunk = []
+               iChunkBytes = 0
+            lChunk.append(bRow)
+            iChunkBytes += len(bRow) + 1
+         c.execute(bBefore + bPrefix + b",".join(lChunk) + bSuffix + bAfter)
+         while c.nextset():
+            pass
+      else:
+         if sBefore:
+            c.execute(sBefore)
+         c.executemany(command,values)
+         if sAfter:
+            c.execute(sAfter)
+
+   def __tGetBulkInsertParts(self, command):
+      """
+Get the encoded statement prefix (``insert ... values``) and suffix of a
+single row insert query for building multi-row insert statements.
+
+The query is analyzed only once per connection, the result is cached.
 
 **Arguments:**
 
-*  ``tbl``
+*  ``command``
 
    / *Condition*: required / *Type*: str /
 
-   Table name to get the last_insert_id.
+   Single row insert query.
 
 **Returns:**
 
-*  ``res``
+*  ``tBulkInsert``
 
-   / *Type*: str /
+   / *Type*: tuple /
 
-   The last_insert_id.
+   Tuple of encoded prefix and suffix, None if the query is not a single row
+   insert query.
       """
-      # "select last_insert_id from table" returns as result a one column table
-      # where the number of rows is the length of the full table.
-      # Each row has the same value of the last_insert_id.
-      # This causes dramatic performance problems.
-      # Anyhow we need only one element, therefore we limit here to 1
-      sql = """select last_insert_id() from """ + self.db + "." + tbl + " limit 1"
-      res = self.__arExec(sql,bHasResponse=True)[0][0]
-      return res
+      try:
+         return self.dBulkInsertParts[command]
+      except KeyError:
+         pass
+      tBulkInsert = None
+      oMatch = CDataBase.__RE_INSERT_VALUES.match(command)
+      if oMatch:
+         sEncoding = self.con.encoding
+         tBulkInsert = (oMatch.group(1).encode(sEncoding),
+                        oMatch.group(3).encode(sEncoding))
+      self.dBulkInsertParts[command] = tBulkInsert
+      return tBulkInsert
 
    def sCreateNewTestResult(self, _tbl_prj_project,
                                   _tbl_prj_variant,
@@ -388,39 +814,28 @@ linked to all other data by means of ``test_result_id``.
 
    ``test_result_id`` of new test result.
       """
-      sql,sqlval = """select count(*) from """ + self.db + """.tbl_prj where
-               (project=%s and variant=%s and branch=%s)""", (_tbl_prj_project,
-                                                              _tbl_prj_variant,
-                                                              _tbl_prj_branch)
-      res = self.__arExec(sql,sqlval,True)[0][0]
-      if res == 0:
-         sql,sqlval = """insert into """ + self.db + """.tbl_prj
-         ( variant,project, branch) values (%s, %s, %s)""" , (_tbl_prj_variant,
-                                                              _tbl_prj_project,
-                                                              _tbl_prj_branch)
-         self.__arExec(sql,sqlval)
-
-      sql,sqlval = """insert into """ + self.db + """.tbl_result (test_result_id,
-         variant,project,branch, time_start,time_end, version_sw_target,
-         version_sw_test,version_hardware,jenkinsurl,reporting_qualitygate,result_state)
-         values (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)""" , (_tbl_test_result_id,
-                                                            _tbl_prj_variant,
-                                                            _tbl_prj_project,
-                                                            _tbl_prj_branch,
-                                                            _tbl_result_time_start,
-                                                            _tbl_result_time_end,
-                                                            _tbl_result_version_sw_target,
-                                                            _tbl_result_version_sw_test,
-                                                            _tbl_result_version_target,
-                                                            _tbl_result_jenkinsurl,
-                                                            _tbl_result_reporting_qualitygate,
-                                                            "in progress")
-      self.__arExec(sql,sqlval)
-
-      if _tbl_result_interpretation!='':
-         sql,sqlval = """update """ + self.db + """.tbl_result set interpretation=%s
-            where test_result_id='""" + _tbl_test_result_id + "'", (_tbl_result_interpretation,)
-         self.__arExec(sql,sqlval)
+      # project and result are written within a single round-trip
+      lSql = [self.__SQL["insert_prj"], self.__SQL["insert_result"]]
+      lSqlVal = [_tbl_prj_variant,
+                 _tbl_prj_project,
+                 _tbl_prj_branch,
+                 _tbl_prj_project,
+                 _tbl_prj_variant,
+                 _tbl_prj_branch,
+                 _tbl_test_result_id,
+                 _tbl_prj_variant,
+                 _tbl_prj_project,
+                 _tbl_prj_branch,
+                 _tbl_result_time_start,
+                 _tbl_result_time_end,
+                 _tbl_result_version_sw_target,
+                 _tbl_result_version_sw_test,
+                 _tbl_result_version_target,
+                 _tbl_result_jenkinsurl,
+                 _tbl_result_reporting_qualitygate,
+                 "in progress",
+                 _tbl_result_interpretation or None]
+      self.__vExecMulti(lSql, lSqlVal)
 
       return _tbl_test_result_id
 
@@ -486,16 +901,14 @@ Create new file entry in ``tbl_file`` table.
 
    ID of new entry.
       """
-      sql,sqlval ="""insert into """ + self.db + """.tbl_file (name,tester_account,
-                     tester_machine,time_start,time_end,test_result_id,origin)
-                     values (%s,%s,%s,%s,%s,%s,%s)""" , ( _tbl_file_name,
-                                                         _tbl_file_tester_account,
-                                                         _tbl_file_tester_machine,
-                                                         _tbl_file_time_start,
-                                                         _tbl_file_time_end,
-                                                         _tbl_test_result_id,
-                                                         _tbl_file_origin)
-      iInsertedID = self.__arExec(sql,sqlval, bReturnInsertedID=True)
+      sqlval = ( _tbl_file_name,
+                 _tbl_file_tester_account,
+                 _tbl_file_tester_machine,
+                 _tbl_file_time_start,
+                 _tbl_file_time_end,
+                 _tbl_test_result_id,
+                 _tbl_file_origin)
+      iInsertedID = self.__arExec(self.__SQL["insert_file"], sqlval, bReturnInsertedID=True)
       return iInsertedID
 
    def vCreateNewHeader(self, _tbl_file_id,
@@ -706,72 +1119,38 @@ Create a new header entry in ``tbl_file_header`` table which is linked with the
 
 (*no returns*)
       """
-      sql,sqlval ="""insert into """ + self.db + """.tbl_file_header
-                        ( file_id,
-                          testtoolconfiguration_testtoolname,
-                          testtoolconfiguration_testtoolversionstring,
-                          testtoolconfiguration_projectname,
-                          testtoolconfiguration_logfileencoding,
-                          testtoolconfiguration_pythonversion,
-                          testtoolconfiguration_testfile,
-                          testtoolconfiguration_logfilepath,
-                          testtoolconfiguration_logfilemode,
-                          testtoolconfiguration_ctrlfilepath,
-                          testtoolconfiguration_configfile,
-                          testtoolconfiguration_confname,
-
-                          testfileheader_author,
-                          testfileheader_project,
-                          testfileheader_testfiledate,
-                          testfileheader_version_major,
-                          testfileheader_version_minor,
-                          testfileheader_version_patch,
-                          testfileheader_keyword,
-                          testfileheader_shortdescription,
-                          testexecution_useraccount,
-                          testexecution_computername,
-
-                          testrequirements_documentmanagement,
-                          testrequirements_testenvironment,
-
-                          testbenchconfig_name,
-                          testbenchconfig_data,
-                          preprocessor_filter,
-                          preprocessor_parameters)
-                  values ( %s, %s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s, %s,
-                           %s, %s, %s,%s,%s,%s,%s,%s,%s,%s,%s,%s)""" , \
-                        ( _tbl_file_id,
-                          _tbl_header_testtoolconfiguration_testtoolname,
-                          _tbl_header_testtoolconfiguration_testtoolversionstring,
-                          _tbl_header_testtoolconfiguration_projectname,
-                          _tbl_header_testtoolconfiguration_logfileencoding,
-                          _tbl_header_testtoolconfiguration_pythonversion,
-                          _tbl_header_testtoolconfiguration_testfile,
-                          _tbl_header_testtoolconfiguration_logfilepath,
-                          _tbl_header_testtoolconfiguration_logfilemode,
-                          _tbl_header_testtoolconfiguration_ctrlfilepath,
-                          _tbl_header_testtoolconfiguration_configfile,
-                          _tbl_header_testtoolconfiguration_confname,
-
-                          _tbl_header_testfileheader_author,
-                          _tbl_header_testfileheader_project,
-                          _tbl_header_testfileheader_testfiledate,
-                          _tbl_header_testfileheader_version_major,
-                          _tbl_header_testfileheader_version_minor,
-                          _tbl_header_testfileheader_version_patch,
-                          _tbl_header_testfileheader_keyword,
-                          _tbl_header_testfileheader_shortdescription,
-                          _tbl_header_testexecution_useraccount,
-                          _tbl_header_testexecution_computername,
-
-                          _tbl_header_testrequirements_documentmanagement,
-                          _tbl_header_testrequirements_testenvironment,
-
-                          _tbl_header_testbenchconfig_name,
-                          _tbl_header_testbenchconfig_data,
-                          _tbl_header_preprocessor_filter,
-                          _tbl_header_preprocessor_parameters)
-      self.__arExec(sql,sqlval)
+      sqlval = ( _tbl_file_id,
+                 _tbl_header_testtoolconfiguration_testtoolname,
+                 _tbl_header_testtoolconfiguration_testtoolversionstring,
+                 _tbl_header_testtoolconfiguration_projectname,
+                 _tbl_header_testtoolconfiguration_logfileencoding,
+                 _tbl_header_testtoolconfiguration_pythonversion,
+                 _tbl_header_testtoolconfiguration_testfile,
+                 _tbl_header_testtoolconfiguration_logfilepath,
+                 _tbl_header_testtoolconfiguration_logfilemode,
+                 _tbl_header_testtoolconfiguration_ctrlfilepath,
+                 _tbl_header_testtoolconfiguration_configfile,
+                 _tbl_header_testtoolconfiguration_confname,
+
+                 _tbl_header_testfileheader_author,
+                 _tbl_header_testfileheader_project,
+                 _tbl_header_testfileheader_testfiledate,
+                 _tbl_header_testfileheader_version_major,
+                 _tbl_header_testfileheader_version_minor,
+                 _tbl_header_testfileheader_version_patch,
+                 _tbl_header_testfileheader_keyword,
+                 _tbl_header_testfileheader_shortdescription,
+                 _tbl_header_testexecution_useraccount,
+                 _tbl_header_testexecution_computername,
+
+                 _tbl_header_testrequirements_documentmanagement,
+                 _tbl_header_testrequirements_testenvironment,
+
+                 _tbl_header_testbenchconfig_name,
+                 _tbl_header_testbenchconfig_data,
+                 _tbl_header_preprocessor_filter,
+                 _tbl_header_preprocessor_parameters)
+      self.__arExec(self.__SQL["insert_file_header"], sqlval)
 
    def nCreateNewSingleTestCase(self,
                                 _tbl_case_name,
@@ -895,10 +1274,6 @@ Create single testcase entry in ``tbl_case`` table immediately.
       """
       if _tbl_case_lastlog == "":
          _tbl_case_lastlog = None
-      sql = """insert into """ + self.db + """.tbl_case (name, issue, tcid, fid,
-               testnumber, repeatcount, component, time_start, result_main, result_state,
-               result_return, counter_resets, lastlog, test_result_id, file_id)
-               values (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"""
       sqlval = (_tbl_case_name,
                 _tbl_case_issue,
                 _tbl_case_tcid,
@@ -915,7 +1290,7 @@ Create single testcase entry in ``tbl_case`` table immediately.
                 _tbl_test_result_id,
                 _tbl_file_id
                )
-      iInsertedTestID = self.__arExec(sql, sqlval, bReturnInsertedID=True)
+      iInsertedTestID = self.__arExec(self.__SQL["insert_single_case"], sqlval, bReturnInsertedID=True)
       return iInsertedTestID
 
    #
@@ -942,7 +1317,9 @@ Create single testcase entry in ``tbl_case`` table immediately.
       """
 Create bulk of test case entries: new test cases are buffered and inserted as bulk.
 
-Once ``__NUM_BUFFERD_ELEMENTS_FOR_EXECUTEMANY`` is reached, the creation query is executed.
+Once the batch size (``iBatchSize``) is reached, the creation query is executed.
+The inserted test cases are committed together with the whole import on
+``disconnect``.
 
 **Arguments:**
 
@@ -1058,17 +1435,18 @@ Once ``__NUM_BUFFERD_ELEMENTS_FOR_EXECUTEMANY`` is reached, the creation query i
                 _tbl_file_id,
                 _tbl_case_lastlog,
                 )
+      # rows are buffered as tuples because both bulk insert paths consume
+      # them row by row (escaping of a row, line of load data file)
       self.lTestCases.append(sqlval)
-      if len(self.lTestCases) >= CDataBase.__NUM_BUFFERD_ELEMENTS_FOR_EXECUTEMANY:
-         self.vEnableForeignKeyCheck(False)
-         self.__vUploadTestCaseListToDb(self.lTestCases)
-         self.vEnableForeignKeyCheck(True)
+      if len(self.lTestCases) >= self.iBatchSize:
+         lTestCases = self.lTestCases
          # Clear test cases list
          self.lTestCases = []
+         self.__vUploadTestCaseListToDb(lTestCases)
 
    def __vUploadTestCaseListToDb(self, lTestCases):
       """
-Bulk insert test case results.
+Bulk insert test case results with disabled foreign key checks.
 
 **Arguments:**
 
@@ -1082,16 +1460,103 @@ Bulk insert test case results.
 
 (*no returns*)
       """
-      sql = """insert into """ + self.db + """.tbl_case (name, issue, tcid, fid,
-            testnumber, repeatcount, component, time_start, result_main, result_state,
-            result_return, counter_resets, test_result_id, file_id, lastlog)
-            values (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"""
-      self.__vExecMany(sql, lTestCases)
+      if self.bLocalInfile and len(lTestCases) >= self.__LOAD_DATA_THRESHOLD:
+         self.vEnableForeignKeyCheck(False)
+         try:
+            self.__vLoadDataToDb(self.__SQL["load_case"], lTestCases)
+            return
+         except db.Error as error:
+            if error.args[0] not in CDataBase.__LOCAL_INFILE_REFUSED_ERRORS:
+               raise
+            # nothing has been loaded, fall back to insert statements
+            print("Load data local infile is refused (%s), using insert statements" % error)
+            self.bLocalInfile = False
+         finally:
+            self.vEnableForeignKeyCheck(True)
+      # foreign key checks are switched within the same round-trips as the inserts
+      try:
+         self.__vExecMany(self.__SQL["insert_case"], lTestCases,
+                          sBefore="SET FOREIGN_KEY_CHECKS=0",
+                          sAfter="SET FOREIGN_KEY_CHECKS=1")
+      except Exception:
+         # checks are enabled together with the last chunk only, which is not
+         # reached after an error
+         self.vEnableForeignKeyCheck(True)
+         raise
+
+   def __vLoadDataToDb(self, command, values):
+      """
+Import many elements with ``load data local infile`` via a temporary file.
+
+**Arguments:**
+
+*  ``command``
+
+   / *Condition*: required / *Type*: str /
+
+   ``load data local infile`` query with a placeholder for the file name.
+
+*  ``values``
+
+   / *Condition*: required / *Type*: list /
+
+   List of rows to be imported.
+
+**Returns:**
+
+(*no returns*)
+      """
+      oFile = tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", newline="\n",
+                                          suffix=".tsv", delete=False)
+      try:
+         with oFile:
+            for row in values:
+               oFile.write("\t".join([self.__sToLoadDataField(val) for val in row]))
+               oFile.write("\n")
+         self.__arExec(command, (oFile.name,))
+      finally:
+         os.remove(oFile.name)
+
+   @staticmethod
+   def __sToLoadDataField(val):
+      """
+Convert a value to a field of the default ``load data`` file format.
+
+**Arguments:**
+
+*  ``val``
+
+   / *Condition*: required / *Type*: str, bytes, int or None /
+
+   Value to be converted.
+
+**Returns:**
+
+*  ``sField``
+
+   / *Type*: str /
+
+   Escaped field value, NULL marker for None.
+      """
+      if val is None:
+         return "\\N"
+      if isinstance(val, bytes):
+         sField = val.decode("utf-8")
+      else:
+         sField = str(val)
+      if "\\" in sField:
+         sField = sField.replace("\\", "\\\\")
+      if "\t" in sField or "\n" in sField or "\r" in sField:
+         sField = sField.replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+      return sField
 
    def vCreateTags(self, _tbl_test_result_id, _tbl_usr_result_tags):
       """
 Create tag entries.
 
+Tag entries are buffered and inserted with a single bulk insert statement
+by ``vFinishTestResult`` (or ``disconnect``).
+
 **Arguments:**
 
 *  ``_tbl_test_result_id``
@@ -1110,9 +1575,25 @@ Create tag entries.
 
 (*no returns*)
       """
-      sql,sqlval="""insert into """ + self.db + """.tbl_usr_result (test_result_id, tags)
-                    values (%s,%s)""", (_tbl_test_result_id , _tbl_usr_result_tags)
-      self.__arExec(sql,sqlval)
+      sqlval = (_tbl_test_result_id , _tbl_usr_result_tags)
+      self.lTags.append(sqlval)
+
+   def __vFlushTags(self):
+      """
+Bulk insert buffered tag entries.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+(*no returns*)
+      """
+      if len(self.lTags) > 0:
+         lTags = self.lTags
+         self.lTags = []
+         self.__vExecMany(self.__SQL["insert_usr_result"], lTags)
 
    def vSetCategory(self, _tbl_test_result_id, tbl_result_category_main):
       """
@@ -1136,10 +1617,8 @@ Create category entry.
 
 (*no returns*)
       """
-      sql="""update """ + self.db + """.tbl_result set category_main='""" + \
-                  tbl_result_category_main + """' where test_result_id='""" + \
-                  _tbl_test_result_id + "'"
-      self.__arExec(sql)
+      self.__arExec(self.__SQL["update_result_category"],
+                    (tbl_result_category_main, _tbl_test_result_id))
 
    def vUpdateStartEndTime(self, _tbl_test_result_id, _tbl_result_time_start, _tbl_result_time_end):
       """
@@ -1169,10 +1648,8 @@ Create start-end time entry.
 
 (*no returns*)
       """
-      sql,sqlval="""update """ + self.db + """.tbl_result set time_start=%s, time_end=%s
-                  where test_result_id='""" + _tbl_test_result_id + "'" , \
-                  (_tbl_result_time_start, _tbl_result_time_end)
-      self.__arExec(sql,sqlval)
+      self.__arExec(self.__SQL["update_result_start_end_time"],
+                    (_tbl_result_time_start, _tbl_result_time_end, _tbl_test_result_id))
 
    def arGetCategories(self):
       """
@@ -1190,11 +1667,9 @@ Get existing categories.
 
    List of exsiting categories.
       """
-      sql="""select category from """ + self.db + """.tbl_result_categories"""
+      sql="""select category from tbl_result_categories"""
       res=self.__arExec(sql, bHasResponse=True)
-      arCategories=[]
-      for cat in res:
-         arCategories.append(cat[0])
+      arCategories=[cat for (cat,) in res]
       return arCategories
 
    #
@@ -1232,13 +1707,11 @@ Create abort reason entry.
 
 (*no returns*)
       """
-      sql,sqlval = """insert into """ + self.db + """.tbl_abort
-                           (test_result_id, abort_reason, msg_detail)
-                           values (%s,%s,%s)""" , (_tbl_test_result_id,
-                                                   _tbl_abort_reason,
-                                                   _tbl_abort_message,
-                                                   )
-      self.__arExec(sql,sqlval)
+      sqlval = (_tbl_test_result_id,
+                _tbl_abort_reason,
+                _tbl_abort_message,
+               )
+      self.__arExec(self.__SQL["insert_abort"],sqlval)
 
    def vCreateReanimation(self, _tbl_test_result_id, _tbl_num_of_reanimation):
       """
@@ -1262,8 +1735,8 @@ Create reanimation entry.
 
 (*no returns*)
       """
-      sql, sqlval = """update """ + self.db + """.tbl_result set num_of_reanimation=%s where
-                        test_result_id='""" + _tbl_test_result_id + "'", (_tbl_num_of_reanimation)
+      sql, sqlval = """update tbl_result set num_of_reanimation=%s where
+                        test_result_id=%s""", (_tbl_num_of_reanimation, _tbl_test_result_id)
       self.__arExec(sql, sqlval)
 
    def vCreateCCRdata(self, _tbl_test_case_id, lCCRdata):
@@ -1288,20 +1761,32 @@ Create CCR data per test case.
 
 (*no returns*)
       """
-      sql = """insert into """ + self.db + """.tbl_ccr (test_case_id, timestamp, MEM, CPU) values(%s,%s,%s,%s)"""
-      sqlVals = []
-      for row in lCCRdata:
-         row.insert(0, _tbl_test_case_id)
-         sqlVals.append(tuple(row))
-      self.__vExecMany(sql, sqlVals)
-
-   def vFinishTestResult(self,_tbl_test_result_id):
+      sqlVals = [(_tbl_test_case_id, *row) for row in lCCRdata]
+      if self.bLocalInfile and len(sqlVals) >= self.__LOAD_DATA_THRESHOLD:
+         try:
+            self.__vLoadDataToDb(self.__SQL["load_ccr"], sqlVals)
+            return
+         except db.Error as error:
+            if error.args[0] not in CDataBase.__LOCAL_INFILE_REFUSED_ERRORS:
+               raise
+            # nothing has been loaded, fall back to insert statements
+            print("Load data local infile is refused (%s), using insert statements" % error)
+            self.bLocalInfile = False
+      self.__vExecMany(self.__SQL["insert_ccr"], sqlVals)
+
+   def vFinishTestResult(self,_tbl_test_result_id, bUpdateEvtbls=False, bUpdateEvtbl=False):
       """
 Finish upload:
 
-* First do bulk insert of rest of test cases if buffer is not empty.
+* First do bulk insert of rest of test cases and tags if buffer is not empty.
 * Then set state to "new report".
 
+The optional stored procedure calls are sent within the same round-trip as
+the state update. Therefore ``update_evtbls`` runs after the rest of the test
+cases is inserted, so that it covers all test cases of the import. Before,
+the importer called ``vUpdateEvtbls`` ahead of ``vFinishTestResult``, and the
+test cases of the last batch were not covered.
+
 **Arguments:**
 
 *  ``_tbl_test_result_id``
@@ -1310,17 +1795,44 @@ Finish upload:
 
    UUID of test result.
 
+*  ``bUpdateEvtbls``
+
+   / *Condition*: optional / *Type*: bool / *Default*: False /
+
+   If True, call ``update_evtbls`` stored procedure after the bulk insert of
+   the rest of test cases and before the state update (same as ``vUpdateEvtbls``).
+
+*  ``bUpdateEvtbl``
+
+   / *Condition*: optional / *Type*: bool / *Default*: False /
+
+   If True, call ``update_evtbl`` stored procedure for the test result after
+   the state update (same as ``vUpdateEvtbl``). Pending calls of
+   ``vUpdateEvtbl`` are always sent with the state update.
+
 **Returns:**
 
 (*no returns*)
       """
       if len(self.lTestCases) > 0:
-         self.vEnableForeignKeyCheck(False)
-         self.__vUploadTestCaseListToDb(self.lTestCases)
-         self.vEnableForeignKeyCheck(True)
-      sql="""update """ + self.db + """.tbl_result set result_state="new report"
-                  where test_result_id='""" + _tbl_test_result_id + "'"
-      self.__arExec(sql)
+         lTestCases = self.lTestCases
+         self.lTestCases = []
+         self.__vUploadTestCaseListToDb(lTestCases)
+      self.__vFlushTags()
+      lSql = []
+      lSqlVal = []
+      if bUpdateEvtbls:
+         lSql.append("call update_evtbls()")
+      lSql.append("""update tbl_result set result_state="new report"
+                  where test_result_id=%s""")
+      lSqlVal.append(_tbl_test_result_id)
+      if bUpdateEvtbl and _tbl_test_result_id not in self.lPendingEvtblIDs:
+         self.lPendingEvtblIDs.append(_tbl_test_result_id)
+      for sTestResultID in self.lPendingEvtblIDs:
+         lSql.append("call update_evtbl(%s)")
+         lSqlVal.append(sTestResultID)
+      self.lPendingEvtblIDs = []
+      self.__vExecMulti(lSql, lSqlVal)
 
    def vUpdateEvtbls(self):
       """
@@ -1334,13 +1846,17 @@ Call ``update_evtbls`` stored procedure.
 
 (*no returns*)
       """
-      sql="""call """ + self.db + """.update_evtbls();"""
+      sql="""call update_evtbls();"""
       self.__arExec(sql)
 
    def vUpdateEvtbl(self, _tbl_test_result_id):
       """
 Call ``update_evtbl`` stored procedure to update provided ``test_result_id``.
 
+The call is deferred and sent together with the other pending calls by
+``vFinishTestResult`` (or ``disconnect``), each test result is updated
+only once.
+
 **Arguments:**
 
 *  ``_tbl_test_result_id``
@@ -1353,8 +1869,30 @@ Call ``update_evtbl`` stored procedure to update provided ``test_result_id``.
 
 (*no returns*)
       """
-      sql="""call """ + self.db + """.update_evtbl('%s');"""%_tbl_test_result_id
-      self.__arExec(sql)
+      if _tbl_test_result_id not in self.lPendingEvtblIDs:
+         self.lPendingEvtblIDs.append(_tbl_test_result_id)
+
+   def vUpdateEvtblList(self, lTestResultIDs):
+      """
+Call ``update_evtbl`` stored procedure for each of the provided
+``test_result_id`` within a single round-trip.
+
+**Arguments:**
+
+*  ``lTestResultIDs``
+
+   / *Condition*: required / *Type*: list /
+
+   List of test result UUIDs.
+
+**Returns:**
+
+(*no returns*)
+      """
+      if not lTestResultIDs:
+         return
+      lSql = ["call update_evtbl(%s)"] * len(lTestResultIDs)
+      self.__vExecMulti(lSql, list(lTestResultIDs))
 
    def vEnableForeignKeyCheck(self, enable=True):
       """
@@ -1375,6 +1913,28 @@ Switch ``foreign_key_checks`` flag.
       sql = "SET FOREIGN_KEY_CHECKS=%s;" %str(int(enable))
       self.__arExec(sql)
 
+   def vEnableUniqueCheck(self, enable=True):
+      """
+Switch ``unique_checks`` flag of the session.
+
+Disabling the unique checks speeds up bulk inserts into tables with
+unique secondary indexes, but duplicate entries are not detected then.
+
+**Arguments:**
+
+*  ``enable``
+
+   / *Condition*: optional / *Type*: bool / *Default*: True /
+
+   If True, enable unique checks.
+
+**Returns:**
+
+(*no returns*)
+      """
+      sql = "SET UNIQUE_CHECKS=%s;" %str(int(enable))
+      self.__arExec(sql)
+
    def sGetLatestFileID(self, _tbl_test_result_id):
       """
 Get latest file ID from ``tbl_file`` table.
@@ -1395,8 +1955,8 @@ Get latest file ID from ``tbl_file`` table.
 
    File ID.
       """
-      sql = "SELECT MAX(file_id) FROM %s.tbl_file WHERE test_result_id='%s'"%(self.db, _tbl_test_result_id)
-      _tbl_file_id = self.__arExec(sql,bHasResponse=True)[0][0]
+      sql = "SELECT MAX(file_id) FROM tbl_file WHERE test_result_id=%s"
+      _tbl_file_id = self.__arExecOne(sql, (_tbl_test_result_id,))[0]
       return _tbl_file_id
 
    def vUpdateFileEndTime(self, _tbl_file_id, _tbl_file_time_end):
@@ -1421,8 +1981,7 @@ Update test file end time.
 
 (*no returns*)
       """
-      sql = "UPDATE %s.tbl_file SET time_end='%s' WHERE file_id=%s"%(self.db, _tbl_file_time_end, _tbl_file_id)
-      self.__arExec(sql)
+      self.__arExec(self.__SQL["update_file_end_time"], (_tbl_file_time_end, _tbl_file_id))
 
    def vUpdateResultEndTime(self, _tbl_test_result_id, _tbl_result_time_end):
       """
@@ -1446,8 +2005,7 @@ Update test result end time.
 
 (*no returns*)
       """
-      sql = "UPDATE %s.tbl_result SET time_end='%s' WHERE test_result_id='%s'"%(self.db, _tbl_result_time_end, _tbl_test_result_id)
-      self.__arExec(sql)
+      self.__arExec(self.__SQL["update_result_end_time"], (_tbl_result_time_end, _tbl_test_result_id))
 
    def bExistingResultID(self, _tbl_test_result_id):
       """
@@ -1469,11 +2027,9 @@ Verify the given test result UUID is existing in ``tbl_result`` table or not.
 
    True if test result UUID is already existing.
       """
-      sql = "SELECT test_result_id FROM %s.tbl_result WHERE test_result_id='%s'"%(self.db, _tbl_test_result_id)
-      res = self.__arExec(sql, bHasResponse=True)
-      bExisting = False
-      if res and len(res)>0:
-         bExisting = True
+      sql = "SELECT 1 FROM tbl_result WHERE test_result_id=%s LIMIT 1"
+      res = self.__arExecOne(sql, (_tbl_test_result_id,))
+      bExisting = res is not None
       return bExisting
 
    def arGetProjectVersionSWByID(self, _tbl_test_result_id):
@@ -1494,9 +2050,5 @@ Get the project and version_sw information of given `test_result_id`
 
    None if test result UUID is not existing, else the tuple which contains project and version_sw: (project, variant) is returned.
       """
-      sql = "SELECT project, version_sw_target FROM %s.tbl_result WHERE test_result_id='%s'"%(self.db, _tbl_test_result_id)
-      res = self.__arExec(sql, bHasResponse=True)
-      if res and len(res)>0:
-         return res[0]
-
-      return None
+      sql = "SELECT project, version_sw_target FROM tbl_result WHERE test_result_id=%s LIMIT 1"
+      return self.__arExecOne(sql, (_tbl_test_result_id,))
@@ -43,12 +43,17 @@
 
 import re
 import uuid
-import base64
+import binascii
 import argparse
+import atexit
 import os
 import sys
 import colorama as col
 import json
+import functools
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from lxml import etree
 from robot.api import ExecutionResult
@@ -78,6 +83,19 @@ DEFAULT_METADATA = {
    "tags"         :  "",
 }
 
+# Precompiled regexes which are used for every suite
+RE_TESTTOOL   = re.compile(r"([a-zA-Z\s\_]+[^\s])\s+([\d\.rcab]+)\s+\(Python\s+(.*)\)")
+RE_SWVERSION  = re.compile(r"(\d+\.)(\d+)([S,F])\d+")
+RE_VERSION_TIME = re.compile(r'(\d{8})\s(\d{2}):(\d{2}):(\d{2})\.\d+')
+# Canonical (lower case) RFC 4122 UUID, group 1 is the version
+RE_UUID       = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-([1-5])[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z")
+# Lookaheads allow to get issue, tcid and fid of a tag with one match
+# and with the same result as searching each info separately:
+# the leading "(?s:.*?)" skips any characters (also line breaks) like
+# re.search does, the captured ID ends at a line break like "(.+)" does
+RE_TAG_IDS    = re.compile(r"(?:(?=(?s:.*?)ISSUE-(.+)))?(?:(?=(?s:.*?)TCID-(.+)))?"
+                           r"(?:(?=(?s:.*?)FID-(.+)))?", re.I)
+
 CONFIG_SCHEMA = {
    "components": [str, dict],
    "variant"   : str,
@@ -87,10 +105,21 @@ CONFIG_SCHEMA = {
    "testtool"  :  str,
    "tester"    :  str
 }
+DEFAULT_XSD_SCHEMA = os.path.join(os.path.dirname(__file__),'xsd/robot.xsd')
 
-iTotalTestcase = 0
-iSuccessTestcase = 0
-dComponentCounter = {}
+class ImportContext():
+   """
+State of one import run which is updated while processing the test cases.
+   """
+   __slots__ = ("iTotalTestcase", "iSuccessTestcase", "dComponentCounter",
+                "iMaxlenComponent")
+
+   def __init__(self):
+      self.iTotalTestcase = 0
+      self.iSuccessTestcase = 0
+      self.dComponentCounter = {}
+      # length of the longest component name for aligned statistics
+      self.iMaxlenComponent = 0
 
 class Logger():
    """
@@ -106,6 +135,9 @@ Logger class for logging message.
    prefix_error   = "ERROR: "
    prefix_fatalerror = "FATAL ERROR: "
    prefix_all = ""
+   prefix_line = color_reset
+   logfile = None
+   logfile_close_registered = False
    dryrun = False
 
    @classmethod
@@ -142,6 +174,32 @@ Configure Logger class.
       cls.dryrun = dryrun
       if cls.dryrun:
          cls.prefix_all = cls.color_warn + "DRYRUN  " + cls.color_reset
+      cls.prefix_line = cls.prefix_all + cls.color_reset
+
+      # Keep the log file open for all messages instead of opening it per message
+      cls.close()
+      if cls.output_logfile!=None:
+         cls.logfile = open(cls.output_logfile, 'a', buffering=1<<16)
+         if not cls.logfile_close_registered:
+            atexit.register(cls.close)
+            cls.logfile_close_registered = True
+
+   @classmethod
+   def close(cls):
+      """
+Close the log file output (if any), buffered messages are written to the file.
+
+**Arguments:**
+
+(*no arguments*)
+
+**Returns:**
+
+(*no returns*)
+      """
+      if cls.logfile != None:
+         cls.logfile.close()
+         cls.logfile = None
 
    @classmethod
    def log(cls, msg='', color=None, indent=0):
@@ -175,11 +233,9 @@ Write log message to console/file output.
       if color==None:
          color = cls.color_normal
       if cls.output_console:
-         print(cls.prefix_all + cls.color_reset + color + " "*indent + msg +
-               cls.color_reset)
-      if cls.output_logfile!=None and os.path.isfile(cls.output_logfile):
-         with open(cls.output_logfile, 'a') as f:
-            f.write(" "*indent + msg)
+         print(cls.prefix_line + color + " "*indent + msg + cls.color_reset)
+      if cls.logfile != None:
+         cls.logfile.write(" "*indent + msg + "\n")
       return
 
    @classmethod
@@ -233,7 +289,50 @@ Write error message to console/file output.
          cls.log(f"{sys.argv[0]} has been stopped!", cls.color_error)
          exit(1)
 
-def collect_xml_result_files(path, search_recursive=False):
+def iter_xml_result_files(path, search_recursive=False):
+   """
+Iterate over all *.xml files in given folder.
+
+The files of a folder are returned before the ones of its sub folders.
+Symbolic links to folders are not followed, folders which cannot be read are
+skipped with a warning.
+
+**Arguments:**
+
+*  ``path``
+
+   / *Condition*: required / *Type*: str /
+
+   Path to folder to be searched.
+
+*  ``search_recursive``
+
+   / *Condition*: optional / *Type*: bool / *Default*: False /
+
+   If set, the sub folders are searched recursively.
+
+**Returns:**
+
+*  / *Type*: generator /
+
+   Path of each found *.xml file.
+   """
+   lSubFolders = []
+   try:
+      with os.scandir(path) as itEntries:
+         for oEntry in itEntries:
+            if oEntry.is_file():
+               if oEntry.name.lower().endswith(".xml"):
+                  yield oEntry.path
+            elif search_recursive and oEntry.is_dir(follow_symlinks=False):
+               lSubFolders.append(oEntry.path)
+   except OSError as reason:
+      # e.g. missing permission, the folder is skipped like os.walk does
+      Logger.log_warning(f"Cannot search folder '{path}' for *.xml result files.\nReason: {reason}")
+   for sSubFolder in lSubFolders:
+      yield from iter_xml_result_files(sSubFolder, True)
+
+def collect_xml_result_files(path, search_recursive=False, jobs=1):
    """
 Collect all valid Robot xml result file in given path.
 
@@ -251,6 +350,12 @@ Collect all valid Robot xml result file in given path.
 
    If set, the given path is searched recursively for xml result files.
 
+*  ``jobs``
+
+   / *Condition*: optional / *Type*: int / *Default*: 1 /
+
+   Number of processes which validate the found xml result files in parallel.
+
 **Returns:**
 
 *  ``lFoundFiles``
@@ -267,31 +372,152 @@ Collect all valid Robot xml result file in given path.
       else:
          if search_recursive:
             Logger.log("Searching *.xml result files recursively...")
-            for root, _, files in os.walk(path):
-               for file in files:
-                  if file.endswith(".xml"):
-                     xml_result_pathfile = os.path.join(root, file)
-                     Logger.log(xml_result_pathfile, indent=2)
-                     validate_xml_result(xml_result_pathfile)
-                     lFoundFiles.append(xml_result_pathfile)
          else:
             Logger.log("Searching *.xml result files...")
-            for file in os.listdir(path):
-               if file.endswith(".xml"):
-                  xml_result_pathfile = os.path.join(path, file)
-                  Logger.log(xml_result_pathfile, indent=2)
-                  validate_xml_result(xml_result_pathfile)
-                  lFoundFiles.append(xml_result_pathfile)
+         for xml_result_pathfile in iter_xml_result_files(path, search_recursive):
+            Logger.log(xml_result_pathfile, indent=2)
+            lFoundFiles.append(xml_result_pathfile)
 
          # Terminate tool with error when no logfile under provided folder
          if len(lFoundFiles) == 0:
             Logger.log_error(f"No *.xml result file under '{path}' folder.", fatal_error=True)
+
+         validate_xml_results(lFoundFiles, jobs=jobs)
    else:
       Logger.log_error(f"Given resultxmlfile is not existing: '{path}'", fatal_error=True)
 
    return lFoundFiles
 
-def validate_xml_result(xml_result, xsd_schema=os.path.join(os.path.dirname(__file__),'xsd/robot.xsd'), exit_on_failure=True):
+@functools.lru_cache(maxsize=4)
+def get_xml_schema(xsd_schema):
+   """
+Get the parsed schema of given *.xsd file.
+
+The parsed schema is cached, so that each *.xsd file is parsed only once
+for all validations.
+
+**Arguments:**
+
+*  ``xsd_schema``
+
+   / *Condition*: required / *Type*: str /
+
+   Path to Robot schema *.xsd file.
+
+**Returns:**
+
+*  ``xmlschema``
+
+   / *Type*: etree.XMLSchema /
+
+   Parsed schema object.
+   """
+   try:
+      xmlschema_doc = etree.parse(xsd_schema)
+      xmlschema = etree.XMLSchema(xmlschema_doc)
+   except Exception as reason:
+      Logger.log_error(f"schema xsd file '{xsd_schema}' is not a valid.\nReason: {reason}", fatal_error=True)
+
+   return xmlschema
+
+def validate_xml_results(lXmlResults, xsd_schema=DEFAULT_XSD_SCHEMA, jobs=1):
+   """
+Verify the given xml result files, exit with fatal error if any of them is invalid.
+
+If ``jobs`` is greater than 1, several files are validated in parallel processes.
+The error of the first invalid file in given order is reported.
+
+**Arguments:**
+
+*  ``lXmlResults``
+
+   / *Condition*: required / *Type*: list /
+
+   List of paths to Robot result files.
+
+*  ``xsd_schema``
+
+   / *Condition*: optional / *Type*: str / *Default*: <installed_folder>\/xsd\/robot.xsd /
+
+   Path to Robot schema *.xsd file.
+
+*  ``jobs``
+
+   / *Condition*: optional / *Type*: int / *Default*: 1 /
+
+   Maximum number of processes which validate the files in parallel.
+
+**Returns:**
+
+(*no returns*)
+   """
+   iWorkers = min(len(lXmlResults), jobs)
+   if iWorkers < 2:
+      for xml_result in lXmlResults:
+         validate_xml_result(xml_result, xsd_schema)
+      return
+
+   # Invalid schema file is reported by the main process
+   get_xml_schema(xsd_schema)
+   try:
+      with ProcessPoolExecutor(max_workers=iWorkers) as oExecutor:
+         lErrors = list(oExecutor.map(get_xml_result_error, lXmlResults,
+                                      [xsd_schema]*len(lXmlResults)))
+   except (OSError, BrokenProcessPool) as reason:
+      # e.g. processes are not permitted or a worker process died
+      Logger.log_warning(f"Parallel validation of xml result files failed, validating sequentially.\nReason: {reason}")
+      lErrors = [get_xml_result_error(xml_result, xsd_schema) for xml_result in lXmlResults]
+   for sError in lErrors:
+      if sError != None:
+         Logger.log_error(sError, fatal_error=True)
+
+def get_xml_result_error(xml_result, xsd_schema=DEFAULT_XSD_SCHEMA):
+   """
+Validate the given xml result file against the schema.
+
+**Arguments:**
+
+*  ``xml_result``
+
+   / *Condition*: required / *Type*: str /
+
+   Path to Robot result file.
+
+*  ``xsd_schema``
+
+   / *Condition*: optional / *Type*: str / *Default*: <installed_folder>\/xsd\/robot.xsd /
+
+   Path to Robot schema *.xsd file.
+
+**Returns:**
+
+*  ``sError``
+
+   / *Type*: str /
+
+   Error message if the given xml result is invalid, otherwise None.
+   """
+   xmlschema = get_xml_schema(xsd_schema)
+
+   # Validate while parsing and release every finished test element,
+   # so that huge result files are never held in memory completely.
+   try:
+      oParser = etree.iterparse(xml_result, events=('end',), tag='test', schema=xmlschema,
+                                huge_tree=True)
+      for _, oElement in oParser:
+         oElement.clear()
+         while oElement.getprevious() is not None:
+            del oElement.getparent()[0]
+   except etree.XMLSyntaxError as reason:
+      if etree.ErrorTypes.SCHEMAV_NOROOT <= reason.code <= etree.ErrorTypes.SCHEMAV_MISC:
+         return f"xml result file '{xml_result}' is not a valid Robot result.\nReason: {reason}"
+      return f"result file '{xml_result}' is not a valid xml format.\nReason: {reason}"
+   except Exception as reason:
+      return f"result file '{xml_result}' is not a valid xml format.\nReason: {reason}"
+
+   return None
+
+def validate_xml_result(xml_result, xsd_schema=DEFAULT_XSD_SCHEMA, exit_on_failure=True):
    """
 Verify the given xml result file is valid or not.
 
@@ -321,22 +547,13 @@ Verify the given xml result file is valid or not.
 
    True if the given xml result is valid with the provided schema *.xsd.
    """
-   try:
-      xmlschema_doc = etree.parse(xsd_schema)
-      xmlschema = etree.XMLSchema(xmlschema_doc)
-   except Exception as reason:
-      Logger.log_error(f"schema xsd file '{xsd_schema}' is not a valid.\nReason: {reason}", fatal_error=True)
+   sError = get_xml_result_error(xml_result, xsd_schema)
+   if sError != None:
+      if exit_on_failure:
+         Logger.log_error(sError, fatal_error=True)
+      return False
 
-   if exit_on_failure:
-      try:
-         xml_doc = etree.parse(xml_result)
-         xmlschema.assert_(xml_doc)
-      except AssertionError as reason:
-         Logger.log_error(f"xml result file '{xml_result}' is not a valid Robot result.\nReason: {reason}", fatal_error=True)
-      except Exception as reason:
-         Logger.log_error(f"result file '{xml_result}' is not a valid xml format.\nReason: {reason}", fatal_error=True)
-
-   return xmlschema.validate(xml_doc)
+   return True
 
 def is_valid_uuid(uuid_to_test, version=4):
    """
@@ -365,16 +582,39 @@ Verify the given UUID is valid or not.
    True if the given UUID is valid.
    """
    bValid = False
-   try:
-      uuid_obj = uuid.UUID(uuid_to_test, version=version)
-   except:
-      return bValid
-
-   if str(uuid_obj) == uuid_to_test:
-      bValid = True
+   if isinstance(uuid_to_test, str):
+      oMatch = RE_UUID.match(uuid_to_test)
+      if oMatch and oMatch.group(1) == str(version):
+         bValid = True
 
    return bValid
 
+def get_schema_types(dSchema):
+   """
+Convert the given configuration schema to tuples of allowed types.
+
+**Arguments:**
+
+*  ``dSchema``
+
+   / *Condition*: required / *Type*: dict /
+
+   Schema with a type or a list of supported types per key.
+
+**Returns:**
+
+*  ``dSchemaTypes``
+
+   / *Type*: dict /
+
+   Tuple of supported types per key, usable with ``isinstance``.
+   """
+   return {key: tuple(types) if isinstance(types, list) else (types,)
+           for key, types in dSchema.items()}
+
+# Supported types per key of the default schema, converted only once
+CONFIG_SCHEMA_TYPES = get_schema_types(CONFIG_SCHEMA)
+
 def is_valid_config(dConfig, dSchema=CONFIG_SCHEMA, bExitOnFail=True):
    """
 Validate the json configuration base on given schema.
@@ -422,30 +662,50 @@ Default schema supports below information:
    True if the given json configuration data is valid.
    """
    bValid = True
-   for key in dConfig:
-      if key in dSchema.keys():
-         # List of support types
-         if isinstance(dSchema[key], list):
-            if type(dConfig[key]) not in dSchema[key]:
-               bValid = False
-         # Fixed type
-         else:
-            if type(dConfig[key]) != dSchema[key]:
-               bValid = False
-
-         if not bValid:
-            Logger.log_error(f"Value of '{key}' has wrong type '{type(dConfig[key])}' in configuration json file.",
-                             fatal_error=bExitOnFail)
-            break
-
-      else:
+   if dSchema is CONFIG_SCHEMA:
+      dSchemaTypes = CONFIG_SCHEMA_TYPES
+   else:
+      dSchemaTypes = get_schema_types(dSchema)
+   for key, value in dConfig.items():
+      tTypes = dSchemaTypes.get(key)
+      if tTypes is None:
          bValid = False
          Logger.log_error(f"Information '{key}' is not supported in configuration json file.",
                           fatal_error=bExitOnFail)
          break
 
+      if not isinstance(value, tTypes):
+         bValid = False
+         Logger.log_error(f"Value of '{key}' has wrong type '{type(value)}' in configuration json file.",
+                          fatal_error=bExitOnFail)
+         break
+
    return bValid
 
+@functools.lru_cache(maxsize=32)
+def get_tag_regex(reInfo):
+   """
+Get the compiled, case-insensitive regex of given tag pattern.
+
+The compiled regex is cached, so that each pattern is compiled only once
+although it is searched in the tags of every test case.
+
+**Arguments:**
+
+*  ``reInfo``
+
+   / *Condition*: required / *Type*: str /
+
+   Regex to get the expectated info (ID) from tag info.
+
+**Returns:**
+
+*  / *Type*: re.Pattern /
+
+   Compiled regex.
+   """
+   return re.compile(reInfo, re.I)
+
 def get_from_tags(lTags, reInfo):
    """
 Extract testcase information from tags.
@@ -476,13 +736,61 @@ Example:
    List of expected information (ID)
    """
    lInfo = []
-   if len(lTags) != 0:
+   if lTags:
       for tag in lTags:
-         oMatch = re.search(reInfo, tag, re.I)
+         oMatch = get_tag_regex(reInfo).search(tag)
          if oMatch:
             lInfo.append(oMatch.group(1))
    return lInfo
 
+def get_ids_from_tags(lTags):
+   """
+Extract issue, testcase and feature IDs from tags in one pass.
+
+Example:
+   ``ISSUE-xxxx``, ``TCID-xxxx``, ``FID-xxxx``
+
+**Arguments:**
+
+*  ``lTags``
+
+   / *Condition*: required / *Type*: list /
+
+   List of tag information.
+
+**Returns:**
+
+*  ``lIssues``
+
+   / *Type*: list /
+
+   List of issue IDs.
+
+*  ``lTCIDs``
+
+   / *Type*: list /
+
+   List of testcase IDs.
+
+*  ``lFIDs``
+
+   / *Type*: list /
+
+   List of feature IDs.
+   """
+   lIssues = []
+   lTCIDs  = []
+   lFIDs   = []
+   for tag in lTags:
+      sIssue, sTCID, sFID = RE_TAG_IDS.match(tag).groups()
+      if sIssue:
+         lIssues.append(sIssue)
+      if sTCID:
+         lTCIDs.append(sTCID)
+      if sFID:
+         lFIDs.append(sFID)
+   return lIssues, lTCIDs, lFIDs
+
 def get_branch_from_swversion(sw_version):
    """
 Get branch name from software version information.
@@ -512,7 +820,7 @@ Convention of branch information in suffix of software version:
    Branch name.
    """
    branch_name = "main"
-   version_number=re.findall(r"(\d+\.)(\d+)([S,F])\d+",sw_version.upper())
+   version_number=RE_SWVERSION.findall(sw_version.upper())
    try:
       branch_name = "".join(version_number[0])
    except:
@@ -542,12 +850,43 @@ Format the given time string to TestResultWebApp's format for importing to db.
    TestResultWebApp's time as format ``%Y-%m-%d %H:%M:%S``.
    """
    try:
-      sFormatedTime = sTime[0:4]+"-"+sTime[4:6]+"-"+sTime[6:]
+      sFormatedTime = f"{sTime[0:4]}-{sTime[4:6]}-{sTime[6:]}"
    except Exception as reason:
       Logger.log_error(f"Cannot convert given time '{sTime}' to TestResultWebApp's time format.\nReason: {reason}",
                         fatal_error=True)
    return sFormatedTime
 
+def format_version_time(sTime):
+   """
+Format the given Robot time string to the default software version.
+
+Example:
+   ``20230101 12:34:56.789`` becomes ``20230101_123456``.
+
+**Arguments:**
+
+*  ``sTime``
+
+   / *Condition*: required / *Type*: str /
+
+   String of time.
+
+**Returns:**
+
+*  ``sVersion``
+
+   / *Type*: str /
+
+   Time as format ``%Y%m%d_%H%M%S``.
+   """
+   # Robot's time format has fixed positions, so slicing is enough for it
+   if (len(sTime) > 18 and sTime[8] == " " and sTime[11] == ":" and
+       sTime[14] == ":" and sTime[17] == "." and
+       (sTime[0:8] + sTime[9:11] + sTime[12:14] + sTime[15:17] + sTime[18:]).isdecimal()):
+      return f"{sTime[0:8]}_{sTime[9:11]}{sTime[12:14]}{sTime[15:17]}"
+
+   return RE_VERSION_TIME.sub(r'\1_\2\3\4', sTime)
+
 def retrieve_result_starttime(objResult):
    """
 Retrieve starttime infomration from given result object (TestSuite or TestCase).
@@ -567,22 +906,19 @@ In case the starttime in given suite is 'N/A', it will try to get this informati
 
    Start time of given result.
    """
-   lStarttime = []
    # Try to get starttime from root TestSuite to children TestCase
    if type(objResult).__name__ == "TestSuite":
       if objResult.starttime:
          return objResult.starttime
-      elif len(objResult.suites) > 0:
-         lStarttime = [suite_starttime for suite in objResult.suites if (suite_starttime:=retrieve_result_starttime(suite)) is not None]
-      else:
-         lStarttime = [test_starttime for test in objResult.tests if (test_starttime:=retrieve_result_starttime(test)) is not None]
+      # min() over a generator finds the starttime in one pass without temporary list
+      lChildren = objResult.suites if objResult.suites else objResult.tests
+      return min((child_starttime for child in lChildren
+                  if (child_starttime:=retrieve_result_starttime(child)) is not None),
+                 default=None)
    elif type(objResult).__name__ == "TestCase":
       if objResult.starttime:
          return objResult.starttime
 
-   if len(lStarttime):
-      return min(lStarttime)
-
    return None
 
 def retrieve_result_endtime(objResult):
@@ -604,22 +940,19 @@ In case the endtime in given suite is 'N/A', it will try to get this information
 
    End time of given result.
    """
-   lEndtime = []
    # Try to get endtime from root TestSuite to children TestCase
    if type(objResult).__name__ == "TestSuite":
       if objResult.endtime:
          return objResult.endtime
-      elif len(objResult.suites) > 0:
-         lEndtime = [suite_endtime for suite in objResult.suites if (suite_endtime:=retrieve_result_endtime(suite)) is not None]
-      else:
-         lEndtime = [test_endtime for test in objResult.tests if (test_endtime:=retrieve_result_endtime(test)) is not None]
+      # max() over a generator finds the endtime in one pass without temporary list
+      lChildren = objResult.suites if objResult.suites else objResult.tests
+      return max((child_endtime for child in lChildren
+                  if (child_endtime:=retrieve_result_endtime(child)) is not None),
+                 default=None)
    elif type(objResult).__name__ == "TestCase":
       if objResult.endtime:
          return objResult.endtime
 
-   if len(lEndtime):
-      return max(lEndtime)
-
    return None
 
 
@@ -642,6 +975,9 @@ Avalable arguments in command line:
    - `--variant` : variant name to be set for this import.
    - `--versions` : metadata: Versions (Software;Hardware;Test) to be set for this import.
    - `--config` : configuration json file for component mapping information.
+   - `--batch-size` : number of test case results which are inserted into database with a single query.
+   - `--fast-load` : if True, then disable unique checks and use ``load data local infile`` for large imports.
+   - `--jobs` : number of processes which validate multiple xml result files in parallel.
 
 **Arguments:**
 
@@ -688,6 +1024,13 @@ Avalable arguments in command line:
                            help='metadata: Versions (Software;Hardware;Test) to be set for this import (semicolon separated).')
    cmdParser.add_argument('--config', type=str,
                            help='configuration json file for component mapping information.')
+   cmdParser.add_argument('--batch-size', type=int, default=10000,
+                           help='number of test case results which are inserted into database with a single query (default: 10000).')
+   cmdParser.add_argument('--fast-load', action="store_true",
+                           help='if set, then disable unique checks and load large test case batches with LOAD DATA LOCAL INFILE. '+\
+                                'Use it only for results which are known to be free of duplicates.')
+   cmdParser.add_argument('--jobs', type=int, default=1,
+                           help='number of processes which validate multiple xml result files in parallel (default: 1).')
 
    return cmdParser.parse_args()
 
@@ -715,13 +1058,15 @@ Metadata at top suite level has a highest priority.
 
 *  ``dMetadata``
 
-   / *Type*: dict /
+   / *Type*: ChainMap /
 
-   Dictionary of Metadata information.
+   Metadata information, see ``process_metadata``.
    """
-   dMetadata = dict(default_metadata)
+   dMetadata = default_metadata
+   if not isinstance(dMetadata, ChainMap):
+      dMetadata = ChainMap(dMetadata)
    # Try to get metadata from first child of suite - multiple log files
-   if suite.suites != None and len(list(suite.suites)) > 0:
+   if suite.suites:
       dMetadata = process_suite_metadata(suite.suites[0], dMetadata)
    # The higher suite level metadata have higher priority
    if suite.metadata != None:
@@ -751,19 +1096,24 @@ Extract metadata from suite result bases on DEFAULT_METADATA.
 
 *  ``dMetadata``
 
-   / *Type*: dict /
+   / *Type*: ChainMap /
 
-   Dictionary of Metadata information.
+   Metadata information: the found values as new layer on top of
+   ``default_metadata``, which is not modified.
    """
-   dMetadata = dict(default_metadata)
-   for key in dMetadata.keys():
+   if not isinstance(default_metadata, ChainMap):
+      default_metadata = ChainMap(default_metadata)
+   # all layers only contain keys of the bottom one
+   dFound = {}
+   for key in default_metadata.maps[-1]:
       if key in metadata:
          if metadata[key] != None:
-            dMetadata[key] = metadata[key]
+            dFound[key] = metadata[key]
 
-   return dMetadata
+   return default_metadata.new_child(dFound)
 
-def process_suite(db, suite, _tbl_test_result_id, root_metadata, dConfig=None):
+def process_suite(db, suite, _tbl_test_result_id, root_metadata, dConfig=None,
+                  lComponentPatterns=None, oContext=None):
    """
 Process to the lowest suite level (test file):
 
@@ -802,14 +1152,33 @@ Process to the lowest suite level (test file):
 
    Configuration data which is parsed from given json configuration file.
 
+*  ``lComponentPatterns``
+
+   / *Condition*: optional / *Type*: list / *Default*: None /
+
+   Compiled component paths from ``get_component_patterns``.
+   They are computed from ``dConfig`` if not provided.
+
+*  ``oContext``
+
+   / *Condition*: optional / *Type*: `ImportContext` object / *Default*: None /
+
+   Import state which counts the processed test cases.
+   A new one is used if not provided.
+
 **Returns:**
 
 (*no returns*)
    """
-   if len(list(suite.suites)) > 0:
+   if lComponentPatterns is None:
+      lComponentPatterns = get_component_patterns(dConfig)
+   if oContext is None:
+      oContext = ImportContext()
+
+   if suite.suites:
       for subsuite in suite.suites:
          process_suite(db, subsuite, _tbl_test_result_id, root_metadata,
-                       dConfig)
+                       dConfig, lComponentPatterns, oContext)
    else:
       # File metadata
       metadata_info = process_metadata(suite.metadata, root_metadata)
@@ -836,22 +1205,11 @@ Process to the lowest suite level (test file):
          # process component mapping if provided in config file
          if dConfig != None and 'components' in dConfig:
             if isinstance(dConfig['components'], dict):
-               for cmpt_name in dConfig['components']:
-                  if isinstance(dConfig['components'][cmpt_name], list):
-                     bFound = False
-                     for path in dConfig['components'][cmpt_name]:
-                        if (normalize_path(path) in
-                            normalize_path(_tbl_file_name)):
-                           metadata_info['component'] = cmpt_name
-                           bFound = True
-                           break
-                     if bFound:
-                        break
-                  elif isinstance(dConfig['components'][cmpt_name], str):
-                     cmpt_path = normalize_path(dConfig['components'][cmpt_name])
-                     if cmpt_path in normalize_path(_tbl_file_name):
-                        metadata_info['component'] = cmpt_name
-                        break
+               sNormFileName = normalize_path(_tbl_file_name)
+               for cmpt_name, oCmptPattern in lComponentPatterns:
+                  if oCmptPattern.search(sNormFileName):
+                     metadata_info['component'] = cmpt_name
+                     break
             elif (isinstance(dConfig['components'], str) and
                   dConfig['components'].strip() != ""):
                metadata_info['component'] = dConfig['components']
@@ -873,49 +1231,49 @@ Process to the lowest suite level (test file):
       Logger.log(f"Created test file result for file '{_tbl_file_name}' successfully: {str(_tbl_file_id)}",
                  indent=2)
 
-      _tbl_header_testtoolname    = ""
-      _tbl_header_testtoolversion = ""
-      _tbl_header_pythonversion   = ""
-      sTestTool = metadata_info['testtool']
-      if dConfig != None and 'testtool' in dConfig:
-         sTestTool = dConfig['testtool']
-      if sTestTool != "":
-         sFindstring=r"([a-zA-Z\s\_]+[^\s])\s+([\d\.rcab]+)\s+\(Python\s+(.*)\)"
-         oTesttool = re.search(sFindstring, sTestTool)
-         if oTesttool:
-            _tbl_header_testtoolname   = oTesttool.group(1)
-            _tbl_header_testtoolversion= oTesttool.group(2)
-            _tbl_header_pythonversion  = oTesttool.group(3)
-
-      _tbl_header_projectname = metadata_info['project']
-      _tbl_header_logfileencoding = "UTF-8"
-      _tbl_header_testfile    = _tbl_file_name
-      _tbl_header_logfilepath = ""
-      _tbl_header_logfilemode = ""
-      _tbl_header_ctrlfilepath= ""
-      _tbl_header_configfile  = metadata_info['configfile']
-      _tbl_header_confname    = ""
-
-      _tbl_header_author        = metadata_info['author']
-      _tbl_header_project       = metadata_info['project']
-      _tbl_header_testfiledate  = ""
-      _tbl_header_version_major = ""
-      _tbl_header_version_minor = ""
-      _tbl_header_version_patch = ""
-      _tbl_header_keyword       = ""
-      _tbl_header_shortdescription = suite.doc
-      _tbl_header_useraccount   = metadata_info['tester']
-      _tbl_header_computername  = metadata_info['machine']
-
-      _tbl_header_testrequirements_documentmanagement = ""
-      _tbl_header_testrequirements_testenvironment    = ""
-
-      _tbl_header_testbenchconfig_name    = ""
-      _tbl_header_testbenchconfig_data    = ""
-      _tbl_header_preprocessor_filter     = ""
-      _tbl_header_preprocessor_parameters = ""
-
+      # File header is only needed for the database, nothing to build for dryrun
       if not Logger.dryrun:
+         _tbl_header_testtoolname    = ""
+         _tbl_header_testtoolversion = ""
+         _tbl_header_pythonversion   = ""
+         sTestTool = metadata_info['testtool']
+         if dConfig != None and 'testtool' in dConfig:
+            sTestTool = dConfig['testtool']
+         if sTestTool != "":
+            oTesttool = RE_TESTTOOL.search(sTestTool)
+            if oTesttool:
+               _tbl_header_testtoolname   = oTesttool.group(1)
+               _tbl_header_testtoolversion= oTesttool.group(2)
+               _tbl_header_pythonversion  = oTesttool.group(3)
+
+         _tbl_header_projectname = metadata_info['project']
+         _tbl_header_logfileencoding = "UTF-8"
+         _tbl_header_testfile    = _tbl_file_name
+         _tbl_header_logfilepath = ""
+         _tbl_header_logfilemode = ""
+         _tbl_header_ctrlfilepath= ""
+         _tbl_header_configfile  = metadata_info['configfile']
+         _tbl_header_confname    = ""
+
+         _tbl_header_author        = metadata_info['author']
+         _tbl_header_project       = metadata_info['project']
+         _tbl_header_testfiledate  = ""
+         _tbl_header_version_major = ""
+         _tbl_header_version_minor = ""
+         _tbl_header_version_patch = ""
+         _tbl_header_keyword       = ""
+         _tbl_header_shortdescription = suite.doc
+         _tbl_header_useraccount   = metadata_info['tester']
+         _tbl_header_computername  = metadata_info['machine']
+
+         _tbl_header_testrequirements_documentmanagement = ""
+         _tbl_header_testrequirements_testenvironment    = ""
+
+         _tbl_header_testbenchconfig_name    = ""
+         _tbl_header_testbenchconfig_data    = ""
+         _tbl_header_preprocessor_filter     = ""
+         _tbl_header_preprocessor_parameters = ""
+
          try:
             db.vCreateNewHeader(_tbl_file_id,
                               _tbl_header_testtoolname,
@@ -952,17 +1310,23 @@ Process to the lowest suite level (test file):
          except Exception as reason:
             Logger.log_error(f"Cannot create new test file header result for file '{_tbl_file_name}' in database.\nReason: {reason}",
                              fatal_error=True)
-      if len(list(suite.tests)) > 0:
+      if suite.tests:
          test_number = 1
          for test in suite.tests:
             process_test(db, test, _tbl_file_id, _tbl_test_result_id,
-                         metadata_info, test_number)
+                         metadata_info, test_number, oContext)
             test_number = test_number + 1
 
-def process_test(db, test, file_id, test_result_id, metadata_info, test_number):
+def process_test(db, test, file_id, test_result_id, metadata_info, test_number,
+                 oContext):
    """
 Process test case data and create new test case record.
 
+The test case record is buffered and inserted together with other ones
+(see ``CDataBase.nCreateNewTestCase``). A test case with an invalid result
+state is skipped, a database error while inserting the buffered test cases
+terminates the import.
+
 **Arguments:**
 
 *  ``db``
@@ -1001,18 +1365,19 @@ Process test case data and create new test case record.
 
    Order of test case in file.
 
+*  ``oContext``
+
+   / *Condition*: required / *Type*: `ImportContext` object /
+
+   Import state which counts the processed test cases.
+
 **Returns:**
 
 (*no returns*)
    """
-   global iTotalTestcase
-   global iSuccessTestcase
-   global dComponentCounter
-   iTotalTestcase += 1
+   dComponentCounter = oContext.dComponentCounter
+   oContext.iTotalTestcase += 1
    _tbl_case_name  = test.name
-   _tbl_case_issue = ";".join(get_from_tags(test.tags, "ISSUE-(.+)"))
-   _tbl_case_tcid  = ";".join(get_from_tags(test.tags, "TCID-(.+)"))
-   _tbl_case_fid   = ";".join(get_from_tags(test.tags, "FID-(.+)"))
    _tbl_case_testnumber  = test_number
    _tbl_case_repeatcount = 1
    _tbl_case_component   = metadata_info['component']
@@ -1020,6 +1385,7 @@ Process test case data and create new test case record.
    _tbl_case_time_end    = format_time(test.endtime)
    if _tbl_case_component not in dComponentCounter:
       dComponentCounter[_tbl_case_component] = 0
+      oContext.iMaxlenComponent = max(oContext.iMaxlenComponent, len(_tbl_case_component))
    try:
       _tbl_case_result_main = DRESULT_MAPPING[test.status]
    except Exception:
@@ -1028,40 +1394,47 @@ Process test case data and create new test case record.
    _tbl_case_result_state   = "complete"
    _tbl_case_result_return  = 11
    _tbl_case_counter_resets = 0
-   try:
-      _tbl_case_lastlog = base64.b64encode(test.message.encode())
-   except:
-      _tbl_case_lastlog = None
    _tbl_test_result_id = test_result_id
    _tbl_file_id = file_id
 
+   # Tags and message are only needed for the database, skip them for dryrun
    if not Logger.dryrun:
+      lIssues, lTCIDs, lFIDs = get_ids_from_tags(test.tags)
+      _tbl_case_issue = ";".join(lIssues)
+      _tbl_case_tcid  = ";".join(lTCIDs)
+      _tbl_case_fid   = ";".join(lFIDs)
+      # Passed tests usually have no message, nothing to encode then
+      if test.message:
+         _tbl_case_lastlog = binascii.b2a_base64(test.message.encode('utf-8', 'replace'), newline=False)
+      else:
+         _tbl_case_lastlog = None
+
+      # test case result is buffered and inserted together with the other ones
+      # (bulk insert) when the batch size is reached or the import is finished
       try:
-         tbl_case_id = db.nCreateNewSingleTestCase(_tbl_case_name,
-                                                   _tbl_case_issue,
-                                                   _tbl_case_tcid,
-                                                   _tbl_case_fid,
-                                                   _tbl_case_testnumber,
-                                                   _tbl_case_repeatcount,
-                                                   _tbl_case_component,
-                                                   _tbl_case_time_start,
-                                                   _tbl_case_result_main,
-                                                   _tbl_case_result_state,
-                                                   _tbl_case_result_return,
-                                                   _tbl_case_counter_resets,
-                                                   _tbl_case_lastlog,
-                                                   _tbl_test_result_id,
-                                                   _tbl_file_id
-                                                )
+         db.nCreateNewTestCase(_tbl_case_name,
+                               _tbl_case_issue,
+                               _tbl_case_tcid,
+                               _tbl_case_fid,
+                               _tbl_case_testnumber,
+                               _tbl_case_repeatcount,
+                               _tbl_case_component,
+                               _tbl_case_time_start,
+                               _tbl_case_result_main,
+                               _tbl_case_result_state,
+                               _tbl_case_result_return,
+                               _tbl_case_counter_resets,
+                               _tbl_case_lastlog,
+                               _tbl_test_result_id,
+                               _tbl_file_id
+                              )
       except Exception as reason:
-         Logger.log_error(f"Cannot create new test case result for test '{_tbl_case_name}' in database.\nReason: {reason}")
-         return
-   else:
-      tbl_case_id = "testcase id for dryrun"
-   iSuccessTestcase += 1
+         Logger.log_error(f"Cannot create new test case results in database.\nReason: {reason}",
+                          fatal_error=True)
+   oContext.iSuccessTestcase += 1
    dComponentCounter[_tbl_case_component] += 1
    component_msg = f" (component: {_tbl_case_component})" if _tbl_case_component != "unknown" else ""
-   Logger.log(f"Created test case result for test '{_tbl_case_name}' successfully: {str(tbl_case_id)}{component_msg}", indent=4)
+   Logger.log(f"Created test case result for test '{_tbl_case_name}' successfully{component_msg}", indent=4)
 
 def process_config_file(config_file):
    """
@@ -1116,6 +1489,42 @@ Parse information from configuration file:
                        fatal_error=True)
    return dConfig
 
+def get_component_patterns(dConfig):
+   """
+Compile the component paths of configuration data once for all files.
+
+All normalized paths of a component are combined to one regex, so that
+a file name is searched only once per component.
+
+**Arguments:**
+
+*  ``dConfig``
+
+   / *Condition*: required / *Type*: dict /
+
+   Configuration data which is parsed from given json configuration file.
+
+**Returns:**
+
+*  ``lComponentPatterns``
+
+   / *Type*: list /
+
+   List of (component name, compiled regex of its normalized paths) in configuration order.
+   """
+   lComponentPatterns = []
+   if dConfig != None and isinstance(dConfig.get('components'), dict):
+      for cmpt_name, cmpt_paths in dConfig['components'].items():
+         if isinstance(cmpt_paths, str):
+            cmpt_paths = [cmpt_paths]
+         elif not isinstance(cmpt_paths, list):
+            continue
+         # a component without any path never matches
+         if len(cmpt_paths) > 0:
+            sPattern = "|".join(re.escape(normalize_path(path)) for path in cmpt_paths)
+            lComponentPatterns.append((cmpt_name, re.compile(sPattern)))
+   return lComponentPatterns
+
 def normalize_path(sPath):
    """
 Normalize path file.
@@ -1139,9 +1548,10 @@ Normalize path file.
 
    #make all backslashes to slash, but mask
    #UNC indicator \\ before and restore after.
-   sNPath=re.sub(r"\\\\",r"#!#!#",sPath.strip())
-   sNPath=re.sub(r"\\",r"/",sNPath)
-   sNPath=re.sub(r"#!#!#",r"\\\\",sNPath)
+   #plain string replacements do the same without regex engine
+   sNPath=sPath.strip().replace("\\\\", "#!#!#")
+   sNPath=sNPath.replace("\\", "/")
+   sNPath=sNPath.replace("#!#!#", "\\\\")
 
    return sNPath
 
@@ -1187,11 +1597,17 @@ Flow to import Robot results to database:
    args = __process_commandline()
    Logger.config(dryrun=args.dryrun)
 
+   if args.jobs < 1:
+      Logger.log_error(f"The provided number of jobs is not valid: '{args.jobs}'",
+                       fatal_error=True)
+
    # 2. Parse results from Robotframework xml result file(s)
-   listEntries = collect_xml_result_files(args.resultxmlfile, args.recursive)
+   listEntries = collect_xml_result_files(args.resultxmlfile, args.recursive, args.jobs)
 
    sources = tuple(listEntries)
-   result = ExecutionResult(*sources)
+   # Keywords are not imported, skipping them while parsing keeps only
+   # suites and tests in memory
+   result = ExecutionResult(*sources, include_keywords=False)
    result.configure()
 
    # get metadata from top level of testsuite
@@ -1213,8 +1629,7 @@ Flow to import Robot results to database:
    # Validate provided versions info (software;hardware;test)
    arVersions = []
    if args.versions!=None and args.versions.strip() != "":
-      arVersions=args.versions.split(";")
-      arVersions=[x.strip() for x in arVersions]
+      arVersions=[x.strip() for x in args.versions.split(";")]
       if len(arVersions)>3:
          Logger.log_error(f"The provided versions information is not valid: '{str(args.versions)}'",
                           fatal_error=True)
@@ -1228,14 +1643,21 @@ Flow to import Robot results to database:
          Logger.log_error(f"The provided config file is not existing: '{args.config}'" ,
                           fatal_error=True)
 
+   if args.batch_size < 1:
+      Logger.log_error(f"The provided batch size is not valid: '{args.batch_size}'",
+                       fatal_error=True)
+
    # 3. Connect to database
-   db=CDataBase()
+   db=CDataBase(iBatchSize=args.batch_size)
    try:
       db.connect(args.server,
                  args.user,
                  args.password,
                  args.database,
-                 "utf8mb4")
+                 "utf8mb4",
+                 bLocalInfile=args.fast_load)
+      if args.fast_load and not Logger.dryrun:
+         db.vEnableUniqueCheck(False)
    except Exception as reason:
       Logger.log_error(f"Could not connect to database: '{reason}'",
                        fatal_error=True)
@@ -1246,159 +1668,184 @@ Flow to import Robot results to database:
    #    '---Create new file result(s)
    #        |
    #        '---Create new test result(s)
+   #    Everything is written within a single transaction which is committed on
+   #    disconnect, a failed import (also fatal error) is rolled back completely.
    try:
-      bUseDefaultPrjVariant = True
-      bUseDefaultVersionSW  = True
-      sMsgVarirantSetBy = sMsgVersionSWSetBy = "default value"
-
-      # Process project/variant info
-      sVariant = metadata_info['project']
-      if args.variant!=None and args.variant.strip() != "":
-         bUseDefaultPrjVariant = False
-         sMsgVarirantSetBy = "from --variant commandline argument"
-         sVariant = args.variant.strip()
-      elif dConfig != None and 'variant' in dConfig:
-         bUseDefaultPrjVariant = False
-         sMsgVarirantSetBy = f"from configuration '{args.config}' file provided by --config"
-         sVariant = dConfig['variant']
-      _tbl_prj_project = _tbl_prj_variant = sVariant
-
-      # Process versions info
-      sVersionSW = metadata_info['version_sw']
-      sVersionHW  = metadata_info['version_hw']
-      sVersionTest   = metadata_info['version_test']
-      if len(arVersions) > 0:
-         bUseDefaultVersionSW = False
-         sMsgVersionSWSetBy = "from --versions commandline argument"
-         if len(arVersions)==1 or len(arVersions)==2 or len(arVersions)==3:
-            sVersionSW = arVersions[0]
-         if len(arVersions)==2 or len(arVersions)==3:
-            sVersionHW = arVersions[1]
-         if len(arVersions)==3:
-            sVersionTest = arVersions[2]
-      elif dConfig != None:
-         if 'version_sw' in dConfig:
+      try:
+         bUseDefaultPrjVariant = True
+         bUseDefaultVersionSW  = True
+         sMsgVarirantSetBy = sMsgVersionSWSetBy = "default value"
+
+         # Process project/variant info
+         sVariant = metadata_info['project']
+         if args.variant!=None and args.variant.strip() != "":
+            bUseDefaultPrjVariant = False
+            sMsgVarirantSetBy = "from --variant commandline argument"
+            sVariant = args.variant.strip()
+         elif dConfig != None and 'variant' in dConfig:
+            bUseDefaultPrjVariant = False
+            sMsgVarirantSetBy = f"from configuration '{args.config}' file provided by --config"
+            sVariant = dConfig['variant']
+         _tbl_prj_project = _tbl_prj_variant = sVariant
+
+         # Process versions info
+         sVersionSW = metadata_info['version_sw']
+         sVersionHW  = metadata_info['version_hw']
+         sVersionTest   = metadata_info['version_test']
+         if len(arVersions) > 0:
             bUseDefaultVersionSW = False
-            sMsgVersionSWSetBy = f"from configuration '{args.config}' file provided by --config"
-            sVersionSW = dConfig['version_sw']
-         if 'version_hw' in dConfig:
-            sVersionHW = dConfig['version_hw']
-         if 'version_test' in dConfig:
-            sVersionTest = dConfig['version_test']
-      _tbl_result_version_sw_target = sVersionSW
-      _tbl_result_version_hardware  = sVersionHW
-      _tbl_result_version_sw_test   = sVersionTest
-
-      # Process start/end time info
-      sExecutionStarttime = retrieve_result_starttime(result.suite)
-      sExecutionEndtime   = retrieve_result_endtime(result.suite)
-      if not sExecutionStarttime:
-         Logger.log_error(f"Could not retieve execution start time."+
-                           "\nPlease use rebot with option '--starttime timestamp' when merging/combining result files."+
-                           "\nOr rerun Robotframework testcase(s) to get proper *.xml result file.",
-                           fatal_error=True)
-      if not sExecutionEndtime:
-         Logger.log_error(f"Could not retieve execution end time."+
-                           "\nPlease use rebot with option '--endtime timestamp' when merging/combining result files."+
-                           "\nOr rerun Robotframework testcase(s) to get proper *.xml result file",
-                           fatal_error=True)
-
-      _tbl_result_time_start = format_time(sExecutionStarttime)
-      _tbl_result_time_end   = format_time(sExecutionEndtime)
-
-      # Set version as start time of the execution if not provided in metadata
-      # Format: %Y%m%d_%H%M%S
-      if _tbl_result_version_sw_target=="":
-         bUseDefaultVersionSW = True
-         _tbl_result_version_sw_target = re.sub(r'(\d{8})\s(\d{2}):(\d{2}):(\d{2})\.\d+',
-                                                r'\1_\2\3\4', sExecutionStarttime)
-      if not args.append:
-         Logger.log(f"Set project/variant to '{sVariant}' ({sMsgVarirantSetBy})")
-         Logger.log(f"Set version_sw to '{_tbl_result_version_sw_target}' ({sMsgVersionSWSetBy})")
-
-      # Process branch info from software version
-      _tbl_prj_branch = get_branch_from_swversion(_tbl_result_version_sw_target)
-
-      # Process UUID info
-      if args.UUID != None:
-         _tbl_test_result_id = args.UUID
-      else:
-         _tbl_test_result_id = str(uuid.uuid4())
-         if args.append:
-            Logger.log_error("'--append' argument should be used in combination with '--UUID <UUID>` argument.", fatal_error=True)
-
-      # Process other info
-      _tbl_result_interpretation = ""
-      _tbl_result_jenkinsurl     = ""
-      _tbl_result_reporting_qualitygate = ""
-
-      # Check the UUID is existing or not
-      error_indent = len(Logger.prefix_fatalerror)*' '
-      _db_result_info = db.arGetProjectVersionSWByID(_tbl_test_result_id)
-      if _db_result_info:
-         if args.append:
-            # Check given variant/project and version_sw (not default values) with existing values in db
-            _db_prj_variant = _db_result_info[0]
-            _db_version_sw  = _db_result_info[1]
-            if not bUseDefaultPrjVariant and _tbl_prj_variant != _db_prj_variant:
-               Logger.log_error(f"Given project/variant '{_tbl_prj_variant}' ({sMsgVarirantSetBy}) is different with existing value '{_db_prj_variant}' in database.", fatal_error=True)
-            elif not bUseDefaultVersionSW and _tbl_result_version_sw_target != _db_version_sw:
-               Logger.log_error(f"Given version software '{_tbl_result_version_sw_target}' ({sMsgVersionSWSetBy}) is different with existing value '{_db_version_sw}' in database.", fatal_error=True)
-            else:
-               Logger.log(f"Append to existing test execution result for variant '{_db_prj_variant}' - version '{_db_version_sw}' - UUID '{_tbl_test_result_id}'.")
+            sMsgVersionSWSetBy = "from --versions commandline argument"
+            # at most 3 versions are given (validated above)
+            sVersionSW = arVersions[0]
+            if len(arVersions) > 1:
+               sVersionHW = arVersions[1]
+            if len(arVersions) > 2:
+               sVersionTest = arVersions[2]
+         elif dConfig != None:
+            if 'version_sw' in dConfig:
+               bUseDefaultVersionSW = False
+               sMsgVersionSWSetBy = f"from configuration '{args.config}' file provided by --config"
+               sVersionSW = dConfig['version_sw']
+            if 'version_hw' in dConfig:
+               sVersionHW = dConfig['version_hw']
+            if 'version_test' in dConfig:
+               sVersionTest = dConfig['version_test']
+         _tbl_result_version_sw_target = sVersionSW
+         _tbl_result_version_hardware  = sVersionHW
+         _tbl_result_version_sw_test   = sVersionTest
+
+         # Process start/end time info
+         sExecutionStarttime = retrieve_result_starttime(result.suite)
+         sExecutionEndtime   = retrieve_result_endtime(result.suite)
+         if not sExecutionStarttime:
+            Logger.log_error(f"Could not retieve execution start time."+
+                              "\nPlease use rebot with option '--starttime timestamp' when merging/combining result files."+
+                              "\nOr rerun Robotframework testcase(s) to get proper *.xml result file.",
+                              fatal_error=True)
+         if not sExecutionEndtime:
+            Logger.log_error(f"Could not retieve execution end time."+
+                              "\nPlease use rebot with option '--endtime timestamp' when merging/combining result files."+
+                              "\nOr rerun Robotframework testcase(s) to get proper *.xml result file",
+                              fatal_error=True)
+
+         _tbl_result_time_start = format_time(sExecutionStarttime)
+         _tbl_result_time_end   = format_time(sExecutionEndtime)
+
+         # Set version as start time of the execution if not provided in metadata
+         # Format: %Y%m%d_%H%M%S
+         if _tbl_result_version_sw_target=="":
+            bUseDefaultVersionSW = True
+            _tbl_result_version_sw_target = format_version_time(sExecutionStarttime)
+         if not args.append:
+            Logger.log(f"Set project/variant to '{sVariant}' ({sMsgVarirantSetBy})")
+            Logger.log(f"Set version_sw to '{_tbl_result_version_sw_target}' ({sMsgVersionSWSetBy})")
+
+         # Process branch info from software version
+         _tbl_prj_branch = get_branch_from_swversion(_tbl_result_version_sw_target)
+
+         # Process UUID info
+         if args.UUID != None:
+            _tbl_test_result_id = args.UUID
          else:
-            Logger.log_error(f"Execution result with UUID '{_tbl_test_result_id}' is already existing. \
-               \n{error_indent}Please use other UUID (or remove '--UUID' argument from your command) for new execution result. \
-               \n{error_indent}Or add '--append' argument in your command to append new result(s) to this existing UUID.",
-               fatal_error=True)
-      else:
-         if args.append:
-            Logger.log_error(f"Execution result with UUID '{_tbl_test_result_id}' is not existing for appending.\
-               \n{error_indent}Please use an existing UUID to append new result(s) to that UUID. \
-               \n{error_indent}Or remove '--append' argument in your command to create new execution result with given UUID.",
-               fatal_error=True)
+            _tbl_test_result_id = str(uuid.uuid4())
+            if args.append:
+               Logger.log_error("'--append' argument should be used in combination with '--UUID <UUID>` argument.", fatal_error=True)
+
+         # Process other info
+         _tbl_result_interpretation = ""
+         _tbl_result_jenkinsurl     = ""
+         _tbl_result_reporting_qualitygate = ""
+
+         # Check the UUID is existing or not
+         error_indent = len(Logger.prefix_fatalerror)*' '
+         # A freshly generated UUID cannot exist yet, so the lookup is only
+         # needed for a UUID given by --UUID
+         _db_result_info = None
+         if args.UUID != None:
+            _db_result_info = db.arGetProjectVersionSWByID(_tbl_test_result_id)
+         if _db_result_info:
+            if args.append:
+               # Check given variant/project and version_sw (not default values) with existing values in db
+               _db_prj_variant = _db_result_info[0]
+               _db_version_sw  = _db_result_info[1]
+               if not bUseDefaultPrjVariant and _tbl_prj_variant != _db_prj_variant:
+                  Logger.log_error(f"Given project/variant '{_tbl_prj_variant}' ({sMsgVarirantSetBy}) is different with existing value '{_db_prj_variant}' in database.", fatal_error=True)
+               elif not bUseDefaultVersionSW and _tbl_result_version_sw_target != _db_version_sw:
+                  Logger.log_error(f"Given version software '{_tbl_result_version_sw_target}' ({sMsgVersionSWSetBy}) is different with existing value '{_db_version_sw}' in database.", fatal_error=True)
+               else:
+                  Logger.log(f"Append to existing test execution result for variant '{_db_prj_variant}' - version '{_db_version_sw}' - UUID '{_tbl_test_result_id}'.")
+            else:
+               Logger.log_error(f"Execution result with UUID '{_tbl_test_result_id}' is already existing. \
+                  \n{error_indent}Please use other UUID (or remove '--UUID' argument from your command) for new execution result. \
+                  \n{error_indent}Or add '--append' argument in your command to append new result(s) to this existing UUID.",
+                  fatal_error=True)
          else:
-            # Process new test result
-            if not Logger.dryrun:
-               db.sCreateNewTestResult(_tbl_prj_project,
-                                       _tbl_prj_variant,
-                                       _tbl_prj_branch,
-                                       _tbl_test_result_id,
-                                       _tbl_result_interpretation,
-                                       _tbl_result_time_start,
-                                       _tbl_result_time_end,
-                                       _tbl_result_version_sw_target,
-                                       _tbl_result_version_sw_test,
-                                       _tbl_result_version_hardware,
-                                       _tbl_result_jenkinsurl,
-                                       _tbl_result_reporting_qualitygate)
-            Logger.log(f"Created test execution result for variant '{_tbl_prj_variant}' - version '{_tbl_result_version_sw_target}' successfully: {str(_tbl_test_result_id)}")
-   except Exception as reason:
-      Logger.log_error(f"Could not create new execution result in database. Reason: {reason}", fatal_error=True)
+            if args.append:
+               Logger.log_error(f"Execution result with UUID '{_tbl_test_result_id}' is not existing for appending.\
+                  \n{error_indent}Please use an existing UUID to append new result(s) to that UUID. \
+                  \n{error_indent}Or remove '--append' argument in your command to create new execution result with given UUID.",
+                  fatal_error=True)
+            else:
+               # Process new test result
+               if not Logger.dryrun:
+                  db.sCreateNewTestResult(_tbl_prj_project,
+                                          _tbl_prj_variant,
+                                          _tbl_prj_branch,
+                                          _tbl_test_result_id,
+                                          _tbl_result_interpretation,
+                                          _tbl_result_time_start,
+                                          _tbl_result_time_end,
+                                          _tbl_result_version_sw_target,
+                                          _tbl_result_version_sw_test,
+                                          _tbl_result_version_hardware,
+                                          _tbl_result_jenkinsurl,
+                                          _tbl_result_reporting_qualitygate)
+               Logger.log(f"Created test execution result for variant '{_tbl_prj_variant}' - version '{_tbl_result_version_sw_target}' successfully: {str(_tbl_test_result_id)}")
+      except Exception as reason:
+         Logger.log_error(f"Could not create new execution result in database. Reason: {reason}", fatal_error=True)
 
-   process_suite(db, result.suite, _tbl_test_result_id, metadata_info, dConfig)
+      oContext = ImportContext()
+      process_suite(db, result.suite, _tbl_test_result_id, metadata_info, dConfig,
+                    oContext=oContext)
 
-   if not Logger.dryrun:
-      db.vUpdateEvtbls()
-      db.vFinishTestResult(_tbl_test_result_id)
-      if args.append:
-         db.vUpdateEvtbl(_tbl_test_result_id)
+      if not Logger.dryrun:
+         try:
+            db.vFinishTestResult(_tbl_test_result_id,
+                                 bUpdateEvtbls=True,
+                                 bUpdateEvtbl=args.append)
+            if args.fast_load:
+               db.vEnableUniqueCheck(True)
+         except Exception as reason:
+            Logger.log_error(f"Could not finish execution result in database. Reason: {reason}",
+                             fatal_error=True)
+   except BaseException:
+      try:
+         db.vRollback()
+      except Exception:
+         # connection is lost, the server discards the open transaction anyway
+         pass
+      raise
 
    # 5. Disconnect from database
    db.disconnect()
    import_mode_msg = "append" if args.append else "written"
+   iTotalTestcase = oContext.iTotalTestcase
+   iSuccessTestcase = oContext.iSuccessTestcase
+   dComponentCounter = oContext.dComponentCounter
    testcnt_msg = f"All {iTotalTestcase}"
    extended_msg = ""
+   # only test cases with invalid result state are skipped,
+   # database errors terminate the import
    if (iTotalTestcase>iSuccessTestcase):
       testcnt_msg  = f"{iSuccessTestcase} of {iTotalTestcase}"
-      extended_msg = f" {iTotalTestcase-iSuccessTestcase} test cases are skipped because of errors."
+      extended_msg = f" {iTotalTestcase-iSuccessTestcase} test cases are skipped because of invalid result state."
    Logger.log()
    Logger.log(f"{testcnt_msg} test cases are {import_mode_msg} to database successfully.{extended_msg}")
 
    # Components's statistics
-   iMaxlenCmptStr = len(max(dComponentCounter, key=len))
-   for component in dComponentCounter:
-      Logger.log(f"Component {component.ljust(iMaxlenCmptStr, ' ')} : {dComponentCounter[component]} test cases")
+   iMaxlenCmptStr = oContext.iMaxlenComponent
+   for component, iCount in dComponentCounter.items():
+      Logger.log(f"Component {component:<{iMaxlenCmptStr}} : {iCount} test cases")
 
 if __name__=="__main__":
    RobotLog2DB()